@@ -0,0 +1 @@
+"""화면(Streamlit 서버) 없이 각 페이지의 계산 부분만 측정하는 벤치마크 (python -m benchmarks.run)"""
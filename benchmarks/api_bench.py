@@ -0,0 +1,241 @@
+"""조회 API(tools/api_server.py) 처리량 측정 클라이언트
+
+    python -m benchmarks.api_bench                           # 응답 캐시 켬/끔 두 서버를 띄워 비교
+    python -m benchmarks.api_bench --clients 16 --duration 5
+    python -m benchmarks.api_bench --url http://127.0.0.1:8780   # 이미 떠 있는 서버 측정
+
+서버는 별도 프로세스로 띄움 (클라이언트 스레드와 GIL을 나눠 쓰지 않도록)
+날씨는 합성 20개 지점 CSV, 도서관 카탈로그는 로컬 대역 서버를 사용하므로 네트워크 없이 실행됨
+결과: 시나리오별 초당 요청 수, 지연시간 p50/p95/p99 -> benchmarks/results/api.json
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import quote, urlencode, urlparse
+
+from benchmarks.loadtest import percentile, start_standins
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'api.json')
+BATCH_SIZE = 20
+
+
+# ------------------------------------------------------------------------------
+# 서버 실행
+# ------------------------------------------------------------------------------
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(cache_size, weather_csv):
+    """api 서버 프로세스 시작 -> (process, base url) (데이터셋 warm-up 이 끝날 때까지 기다림)"""
+    port = _free_port()
+    cmd = [sys.executable, '-m', 'tools.api_server', '--port', str(port), '--cache-size', str(cache_size),
+           '--weather-csv', weather_csv]
+    proc = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    proc.stdout.readline()  # warm-up 후 주소를 출력하면 준비 완료
+    return proc, f'http://127.0.0.1:{port}'
+
+
+# ------------------------------------------------------------------------------
+# 시나리오: 각 함수는 (method, path, body, headers) 목록을 만들어냄 (목록 하나 = 측정 1회)
+# ------------------------------------------------------------------------------
+def _get(path, params=None, headers=None):
+    query = f'?{urlencode(params, quote_via=quote)}' if params else ''
+    return ('GET', path + query, None, headers or {})
+
+
+def _random_query(rng, catalog):
+    kind = rng.randrange(3)
+    if kind == 0:
+        return '/weather/trend', {'station': str(rng.choice(catalog['stations']))}
+    if kind == 1:
+        return '/mbti/country', {'country': rng.choice(catalog['countries'])}
+    return '/mbti/rank', {'type': rng.choice(catalog['types']), 'top': '10'}
+
+
+def build_scenarios(catalog, etags):
+    def trend(rng):
+        return [_get('/weather/trend', {'station': str(rng.choice(catalog['stations']))})]
+
+    def yearly(rng):
+        return [_get('/weather/yearly', {'station': str(rng.choice(catalog['stations']))})]
+
+    def country(rng):
+        return [_get('/mbti/country', {'country': rng.choice(catalog['countries'])})]
+
+    def facets(rng):
+        return [_get('/library/facets', {'type': rng.choice(catalog['library_types'])})]
+
+    def revalidate(rng):
+        path, etag = rng.choice(etags)
+        return [('GET', path, None, {'If-None-Match': etag})]
+
+    def separate(rng):
+        return [_get(*_random_query(rng, catalog)) for _ in range(BATCH_SIZE)]
+
+    def batch(rng):
+        requests = [dict(zip(('path', 'params'), _random_query(rng, catalog))) for _ in range(BATCH_SIZE)]
+        body = json.dumps({'requests': requests}).encode('utf-8')
+        return [('POST', '/batch', body, {'Content-Type': 'application/json'})]
+
+    scenarios = {
+        'weather.trend': trend,
+        'weather.yearly': yearly,
+        'mbti.country': country,
+        'revalidate_304': revalidate,
+        f'separate_x{BATCH_SIZE}': separate,
+        f'batch_x{BATCH_SIZE}': batch,
+    }
+    if catalog['library_types']:
+        scenarios['library.facets'] = facets
+    return scenarios
+
+
+# ------------------------------------------------------------------------------
+# 측정
+# ------------------------------------------------------------------------------
+def fetch_json(base, path):
+    conn = http.client.HTTPConnection(urlparse(base).netloc, timeout=30)
+    try:
+        conn.request('GET', path)
+        resp = conn.getresponse()
+        return resp.status, resp.getheader('ETag'), json.loads(resp.read() or b'null')
+    finally:
+        conn.close()
+
+
+def discover(base):
+    """측정에 쓸 지점/국가/유형 목록 + 재검증(304) 시나리오용 ETag"""
+    _, _, stations = fetch_json(base, '/weather/stations')
+    _, _, mbti = fetch_json(base, '/mbti/types')
+    status, _, library = fetch_json(base, '/library/facets')
+    catalog = {
+        'stations': [s['station'] for s in stations['stations']],
+        'countries': mbti['countries'],
+        'types': mbti['types'],
+        'library_types': list(library['types']) if status == 200 else [],
+    }
+
+    etags = []
+    for station in catalog['stations']:
+        path = _get('/weather/trend', {'station': str(station)})[1]
+        etags.append((path, fetch_json(base, path)[1]))
+    return catalog, etags
+
+
+def run_scenario(base, make_ops, clients, duration, seed):
+    latencies, counts, errors, lock = [], [0], [], threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(i):
+        rng = random.Random(seed + i)
+        conn = http.client.HTTPConnection(urlparse(base).netloc, timeout=30)
+        local, requests = [], 0
+        try:
+            while time.perf_counter() < deadline:
+                ops = make_ops(rng)
+                started = time.perf_counter()
+                for method, path, body, headers in ops:
+                    conn.request(method, path, body=body, headers=headers)
+                    resp = conn.getresponse()
+                    resp.read()
+                    if resp.status not in (200, 304):
+                        raise RuntimeError(f'{method} {path} -> {resp.status}')
+                local.append(time.perf_counter() - started)
+                requests += len(ops)
+        except Exception as e:
+            with lock:
+                errors.append(f'{type(e).__name__}: {e}')
+        finally:
+            conn.close()
+        with lock:
+            latencies.extend(local)
+            counts[0] += requests
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'ops': len(latencies),
+        'requests': counts[0],
+        'ops_per_sec': len(latencies) / wall,
+        'requests_per_sec': counts[0] / wall,
+        'p50': percentile(latencies, 0.50),
+        'p95': percentile(latencies, 0.95),
+        'p99': percentile(latencies, 0.99),
+        'errors': errors,
+    }
+
+
+def bench_server(base, args):
+    catalog, etags = discover(base)
+    results = {}
+    for name, make_ops in build_scenarios(catalog, etags).items():
+        if args.filter not in name:
+            continue
+        results[name] = r = run_scenario(base, make_ops, args.clients, args.duration, args.seed)
+        print(f"  {name:<18}{r['ops_per_sec']:>10.0f}{r['requests_per_sec']:>10.0f}"
+              f"{r['p50'] * 1000:>10.2f}{r['p95'] * 1000:>10.2f}{r['p99'] * 1000:>10.2f}  {len(r['errors'])}",
+              flush=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help='이미 떠 있는 서버 주소 (없으면 캐시 켬/끔 서버를 직접 띄움)')
+    parser.add_argument('--clients', type=int, default=8, help='동시 클라이언트(연결) 수')
+    parser.add_argument('--duration', type=float, default=3.0, help='시나리오당 측정 시간(초)')
+    parser.add_argument('--stations', type=int, default=20, help='합성 날씨 데이터 지점 수')
+    parser.add_argument('-k', '--filter', default='', help='이름에 이 문자열이 들어간 시나리오만')
+    parser.add_argument('--seed', type=int, default=251218)
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    header = f"  {'scenario':<18}{'ops/s':>10}{'req/s':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}  errors"
+    report = {'clients': args.clients, 'duration': args.duration, 'servers': {}}
+    if args.url:
+        print(args.url + '\n' + header)
+        report['servers']['external'] = bench_server(args.url, args)
+    else:
+        os.chdir(ROOT)
+        if ROOT not in sys.path:
+            sys.path.insert(0, ROOT)
+        from benchmarks.cases import CACHE_DIR
+        from benchmarks.synthetic import scaled_weather_csv
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        weather_csv = scaled_weather_csv(CACHE_DIR, args.stations)
+        standin = start_standins()  # 환경 변수로 서버 프로세스에 도서관 CSV 주소 전달
+        for label, cache_size in [('cache_on', 1024), ('cache_off', 0)]:
+            proc, base = start_server(cache_size, weather_csv)
+            try:
+                print(f"\n[{label}] {base}\n{header}")
+                report['servers'][label] = bench_server(base, args)
+            finally:
+                proc.terminate()
+                proc.wait()
+        standin.shutdown()
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
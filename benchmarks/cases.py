@@ -0,0 +1,127 @@
+import os
+import random
+
+from benchmarks import synthetic
+from services.library import filter_catalog
+from services.maze import generate_maze, write_maze
+from services.mbti_data import build_rollups, country_distribution, load_mbti, rank_countries
+from services.weather_charts import build_trend_figure, station_series
+from services.weather_data import linear_trend, load_daily, yearly_extremes, yearly_means
+
+# ------------------------------------------------------------------------------
+# 벤치마크 케이스: setup()/teardown(state)은 측정에서 제외, run(state)만 반복 측정
+# ------------------------------------------------------------------------------
+# profile: 'quick' = 기본 실행, 'full' = --full 일 때만 (수십 초 이상 걸리는 큰 입력)
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '.cache')
+
+
+class Case:
+    def __init__(self, name, run, setup=None, teardown=None, profile='quick'):
+        self.name = name
+        self.run = run
+        self.setup = setup or (lambda: None)
+        self.teardown = teardown or (lambda state: None)  # setup 이 연 파일 등 정리
+        self.profile = profile
+
+
+def _weather_csv(stations):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return synthetic.scaled_weather_csv(CACHE_DIR, stations)
+
+
+def _mbti_plot_prep(df):
+    # mbti02.py Tab 1/2: 전체 평균 순위 + 국가별 분포 + 묶음 합계
+    mbti_cols = df.columns[1:]
+    df[mbti_cols].mean().sort_values(ascending=False)
+    country_distribution(df, '대한민국')
+    build_rollups(df)
+
+
+def _mbti_rank_all(df):
+    # mbti02.py Tab 3: 32개 유형 모두 순위 계산
+    for mbti_type in df.columns[1:]:
+        rank_countries(df, mbti_type)
+
+
+def _library_facets(df):
+    # library.py: 자료유형 목록 + 유형별 분야 목록
+    types = sorted(df['자료유형'].dropna().unique())
+    for t in types:
+        sorted(filter_catalog(df, {'자료유형': t})['분야'].dropna().unique())
+
+
+def _library_filter(df):
+    for t in ['전체', '전자책', '오디오북']:
+        for c in ['전체', '문학', '컴퓨터']:
+            len(filter_catalog(df, {'자료유형': t, '분야': c}))
+
+
+def _trend_inputs(resolution):
+    # weather02.py 그래프 입력 (번들 데이터의 첫 지점)
+    daily = load_daily(synthetic.WEATHER_CSV_PATH)
+    station = int(daily['지점'].iloc[0])
+    slope, intercept = linear_trend(yearly_means(daily[daily['지점'] == station]))
+    return station_series(daily, station, resolution), slope, intercept, resolution
+
+
+def _plotly_marshal(fig):
+    # st.plotly_chart 가 매 실행마다 하는 일: 그림 확인 + JSON 직렬화
+    import plotly.io as pio
+    import plotly.tools
+    pio.to_json(plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True), validate=False)
+
+
+def _maze(grid):
+    return Case(f'maze.generate_{grid}',
+                run=lambda rng: generate_maze(grid, 0.4, rng),
+                setup=lambda: random.Random(synthetic.SEED),
+                profile='full' if grid >= 2000 else 'quick')
+
+
+def _maze_stream(width, rows):
+    # 전체를 메모리에 올리지 않는 Eller 스트리밍 미로 (PNG로 압축해서 버림)
+    def run(sink):
+        write_maze(sink, width, rows, 0.4, seed=synthetic.SEED, fmt='png')
+    return Case(f'maze.stream_{width}x{rows}', run=run, setup=lambda: open(os.devnull, 'wb'),
+                teardown=lambda sink: sink.close(), profile='full' if width * rows > 1_000_000 else 'quick')
+
+
+CASES = [
+    # --- weather.py / weather02.py ---
+    Case('weather.load', run=lambda path: load_daily(path), setup=lambda: synthetic.WEATHER_CSV_PATH),
+    Case('weather.aggregate', run=lambda d: (yearly_extremes(d), yearly_means(d)),
+         setup=lambda: load_daily(synthetic.WEATHER_CSV_PATH)),
+    Case('weather.trend', run=lambda y: linear_trend(y),
+         setup=lambda: yearly_means(load_daily(synthetic.WEATHER_CSV_PATH))),
+    Case('weather.load_x20', run=lambda path: load_daily(path), setup=lambda: _weather_csv(20)),
+    Case('weather.aggregate_x20', run=lambda d: (yearly_extremes(d), yearly_means(d)),
+         setup=lambda: load_daily(_weather_csv(20))),
+
+    # --- weather02.py 그래프: 만들기 vs 직렬화 (캐시는 만들기만 건너뜀, 직렬화는 매 실행마다 남음) ---
+    Case('weather02.figure_year', run=lambda a: build_trend_figure(*a), setup=lambda: _trend_inputs('year')),
+    Case('weather02.figure_day', run=lambda a: build_trend_figure(*a), setup=lambda: _trend_inputs('day')),
+    Case('weather02.marshal_year', run=_plotly_marshal,
+         setup=lambda: build_trend_figure(*_trend_inputs('year'))),
+    Case('weather02.marshal_day_webgl', run=_plotly_marshal,
+         setup=lambda: build_trend_figure(*_trend_inputs('day'))),
+    Case('weather02.marshal_day_svg', run=_plotly_marshal,
+         setup=lambda: build_trend_figure(*_trend_inputs('day'), webgl=False)),
+
+    # --- mbti02.py ---
+    Case('mbti.load', run=lambda path: load_mbti(path), setup=lambda: synthetic.MBTI_CSV_PATH),
+    Case('mbti.plot_prep', run=_mbti_plot_prep, setup=load_mbti),
+    Case('mbti.rank', run=_mbti_rank_all, setup=load_mbti),
+    Case('mbti.plot_prep_10k', run=_mbti_plot_prep, setup=lambda: synthetic.scaled_mbti(10_000)),
+    Case('mbti.rank_10k', run=_mbti_rank_all, setup=lambda: synthetic.scaled_mbti(10_000)),
+
+    # --- library.py (합성 50만 권 카탈로그) ---
+    Case('library.facets_500k', run=_library_facets, setup=lambda: synthetic.library_catalog(500_000)),
+    Case('library.filter_500k', run=_library_filter, setup=lambda: synthetic.library_catalog(500_000)),
+
+    # --- maze.py ---
+    _maze(25),
+    _maze(200),
+    _maze(2000),
+    _maze_stream(10_000, 20),
+    _maze_stream(20_000, 500),
+]
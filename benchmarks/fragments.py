@@ -0,0 +1,160 @@
+"""fragment 적용 전/후 상호작용 지연시간 비교 (mbti02.py 탭, library.py 검색 패널)
+
+    python -m benchmarks.fragments
+    python -m benchmarks.fragments --steps 20 -k mbti02
+
+같은 위젯 조작을 두 방식으로 재실행해서 비교
+  - before: 스크립트 전체 재실행 (fragment 가 없을 때의 동작 = AppTest 기본 동작)
+  - after : 조작한 위젯이 들어있는 fragment 만 재실행 (브라우저에서 실제로 일어나는 동작)
+AppTest 는 항상 전체를 다시 실행하므로, after 는 AppTest 의 스크립트 러너에 fragment id 를
+실어 보내는 방식으로 재현함 (Streamlit 내부 구조에 의존하는 측정 전용 코드)
+-> 확인한 Streamlit 버전(STREAMLIT_VERSIONS)이 아니면 측정하지 않고 바로 종료
+
+도서관 카탈로그는 로컬 대역 서버의 합성 데이터를 사용 (--library-rows)
+결과: 시나리오별 before/after p50·mean·p95 -> benchmarks/results/fragments.json
+"""
+import argparse
+import contextlib
+import functools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import warnings
+
+from benchmarks.loadtest import percentile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'fragments.json')
+
+# AppTest 내부(_fragment_storage, local_script_runner.RerunData)를 직접 쓰므로 확인한 버전만 허용
+# Streamlit 을 올리면 after 가 실제로 fragment 만 재실행하는지 확인한 뒤 여기에 추가
+STREAMLIT_VERSIONS = ('1.66',)
+
+# 이름 -> (페이지, fragment 함수 이름, 조작할 selectbox key)
+SCENARIOS = {
+    'mbti02.country': ('pages/mbti02.py', 'render_country_tab', 'country_select'),
+    'mbti02.rank': ('pages/mbti02.py', 'render_rank_tab', 'rank_type'),
+    'mbti02.rollup': ('pages/mbti02.py', 'render_rollup_tab', 'rollup_scope'),
+    'library.type': ('pages/library.py', 'search_panel', 'lib_type'),
+    'library.category': ('pages/library.py', 'search_panel', 'lib_category'),
+}
+
+
+def check_streamlit():
+    """확인하지 않은 Streamlit 버전이거나 필요한 내부 구조가 없으면 RuntimeError"""
+    import dataclasses
+
+    import streamlit
+    from streamlit.testing.v1 import local_script_runner
+
+    version = '.'.join(streamlit.__version__.split('.')[:2])
+    if version not in STREAMLIT_VERSIONS:
+        raise RuntimeError(f"Streamlit {streamlit.__version__} 은 확인하지 않은 버전 "
+                           f"(지원: {', '.join(STREAMLIT_VERSIONS)}) - AppTest 내부 구조를 다시 확인할 것")
+    fields = {f.name for f in dataclasses.fields(local_script_runner.RerunData)}
+    if 'fragment_id_queue' not in fields:
+        raise RuntimeError("RerunData 에 fragment_id_queue 가 없음 - fragment 재실행을 재현할 수 없음")
+    return streamlit.__version__
+
+
+def fragment_id(at, func_name):
+    """AppTest 가 보관 중인 fragment 중 func_name 함수를 감싼 것의 id"""
+    for fid, fragment in at._fragment_storage._fragments.items():
+        for cell in fragment.__closure__ or ():
+            if getattr(cell.cell_contents, '__name__', None) == func_name:
+                return fid
+    raise LookupError(f"fragment '{func_name}' 를 찾을 수 없음")
+
+
+@contextlib.contextmanager
+def fragment_rerun(fid):
+    """이 블록 안의 at.run() 은 fragment fid 만 다시 실행"""
+    from streamlit.testing.v1 import local_script_runner
+
+    original = local_script_runner.RerunData
+    local_script_runner.RerunData = functools.partial(original, fragment_id_queue=[fid])
+    try:
+        yield
+    finally:
+        local_script_runner.RerunData = original
+
+
+def measure(page, func_name, key, steps, seed, timeout, scoped):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=timeout)
+    at.run()
+    fid = fragment_id(at, func_name)
+
+    samples = []
+    for _ in range(steps):
+        box = at.selectbox(key=key)
+        box.set_value(rng.choice([o for o in box.options if o != box.value] or box.options))
+        started = time.perf_counter()
+        if scoped:
+            with fragment_rerun(fid):
+                at.run()
+        else:
+            at.run()
+        samples.append(time.perf_counter() - started)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    samples.sort()
+    return {
+        'p50': percentile(samples, 0.50),
+        'p95': percentile(samples, 0.95),
+        'mean': statistics.fmean(samples),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', '--filter', default='', help='이름에 이 문자열이 들어간 시나리오만')
+    parser.add_argument('--steps', type=int, default=10, help='시나리오당 위젯 조작 횟수')
+    parser.add_argument('--library-rows', type=int, default=20000, help='합성 도서관 카탈로그 행 수')
+    parser.add_argument('--seed', type=int, default=251218)
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    warnings.filterwarnings('ignore')  # seaborn palette / 폰트 경고가 표를 가림
+    try:
+        streamlit_version = check_streamlit()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    from benchmarks import loadtest
+    loadtest._library_csv = functools.partial(loadtest._library_csv, args.library_rows)
+    server = loadtest.start_standins()
+
+    print(f"{'scenario':<18}{'before p50':>12}{'after p50':>12}{'before mean':>13}{'after mean':>12}{'speedup':>9}")
+    results = {}
+    for name, (page, func_name, key) in SCENARIOS.items():
+        if args.filter not in name:
+            continue
+        before = measure(page, func_name, key, args.steps, args.seed, args.timeout, scoped=False)
+        after = measure(page, func_name, key, args.steps, args.seed, args.timeout, scoped=True)
+        speedup = before['mean'] / after['mean'] if after['mean'] else float('inf')
+        results[name] = {'before': before, 'after': after, 'speedup': speedup}
+        print(f"{name:<18}{before['p50'] * 1000:>10.0f}ms{after['p50'] * 1000:>10.0f}ms"
+              f"{before['mean'] * 1000:>11.0f}ms{after['mean'] * 1000:>10.0f}ms{speedup:>8.1f}x", flush=True)
+    server.shutdown()
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'streamlit': streamlit_version, 'steps': args.steps, 'library_rows': args.library_rows,
+                   'scenarios': results},
+                  f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,418 @@
+"""동시 접속 부하 테스트: 실제 Streamlit 서버 프로세스 하나에 웹소켓 세션 N개가 동시에 각 페이지를 클릭
+
+    python -m benchmarks.loadtest                          # 세션 1, 5, 10, 20개 단계별
+    python -m benchmarks.loadtest --sessions 30 --steps 10
+    python -m benchmarks.loadtest --pages mbti02 maze --target-p95 1.0
+
+`streamlit run main2.py --server.headless true` 서버 하나를 띄우고, 이 프로세스에서 브라우저 대신
+웹소켓 클라이언트(/_stcore/stream, BackMsg/ForwardMsg 프로토콜)를 세션 수만큼 열어 동시에 조작함.
+위젯을 바꿀 때는 브라우저처럼 모든 위젯 상태를 다시 보내고, fragment 안의 위젯이면 그 fragment 만 재실행 요청.
+따라서 서버 하나의 GIL / 공용 캐시(st.cache_*, 데이터셋 레지스트리) / 워밍업 스레드 공유가 그대로 재현됨
+(단계는 같은 서버에서 차례로 실행하므로 두 번째 단계부터는 공용 캐시가 채워진 상태).
+
+외부 의존(구글 시트, 쇼핑몰, 표지 이미지, 폰트)은 모두 tools/standin_server.py 로컬 대역 서버로
+대체하므로 네트워크 없이 실행됨. 클라이언트도 같은 기계에서 돌기 때문에 CPU 를 조금 나눠 씀.
+
+결과: 단계별 rerun 지연시간 p50/p95/p99, 처리량, 서버 프로세스 RSS(단계 시작/최대) -> benchmarks/results/loadtest.json
+--target-p95 를 주면 p95가 목표 이하인 최대 동시 세션 수를 "서버당 수용 인원"으로 출력
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'loadtest.json')
+PAGE_NAMES = ['main2', 'mbti', 'mbti02', 'maze', 'library', 'minimizing', 'weather', 'weather02']
+
+
+# ------------------------------------------------------------------------------
+# 로컬 대역 서버 (도서관 CSV / 표지 이미지 / 한글 폰트 / 쇼핑몰 검색 결과)
+# ------------------------------------------------------------------------------
+# 1x1 투명 PNG
+_PNG = bytes.fromhex('89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+                     '1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082')
+
+
+def _library_csv(rows=3000):
+    from benchmarks.synthetic import library_catalog
+    df = library_catalog(rows)
+    buf = io.StringIO()
+    df.to_csv(buf, index=False)
+    return buf.getvalue().encode('utf-8')
+
+
+def start_standins():
+    """대역 서버를 띄우고 앱이 그쪽을 보도록 환경 변수 설정 -> server"""
+    import matplotlib
+    from services import plotting
+    from tools.standin_server import start_standin_server
+
+    # 폰트: 저장소에 받아 둔 나눔고딕이 있으면 그것을, 없으면 matplotlib 기본 폰트(한글 없음)를 대신 제공
+    font_path = os.path.join(ROOT, 'NanumGothic.ttf')
+    if not (os.path.exists(font_path) and plotting.is_korean_font(font_path)):
+        font_path = os.path.join(os.path.dirname(matplotlib.__file__), 'mpl-data', 'fonts', 'ttf', 'DejaVuSans.ttf')
+    with open(font_path, 'rb') as f:
+        font = f.read()
+
+    server, port = start_standin_server(routes={
+        '/sheet.csv': ('text/csv; charset=utf-8', _library_csv()),
+        '/img/': ('image/png', _PNG),
+        '/font.ttf': ('font/ttf', font),
+    })
+    base = f'http://127.0.0.1:{port}'
+    os.environ['LIBRARY_CSV_URL'] = f'{base}/sheet.csv'
+    os.environ['KOREAN_FONT_URL'] = f'{base}/font.ttf'
+    # 대역 폰트가 저장소의 NanumGothic.ttf 캐시를 덮어쓰지 않도록 임시 경로에 받게 함
+    os.environ['KOREAN_FONT_FILE'] = os.path.join(tempfile.mkdtemp(), 'NanumGothic.ttf')
+    plotting.FONT_URL, plotting.FONT_FILE = os.environ['KOREAN_FONT_URL'], os.environ['KOREAN_FONT_FILE']  # 이미 import 됨
+    os.environ['PRICE_SEARCH_BASE_URL'] = base
+    # 부하 테스트 검색어가 실제 자동완성 기록에 섞이지 않도록
+    os.environ['QUERY_LOG_PATH'] = os.path.join(tempfile.mkdtemp(), 'query_log.txt')
+    return server
+
+
+# ------------------------------------------------------------------------------
+# 페이지별 클릭 시나리오: 각 함수는 (동작 이름, 위젯을 바꾸는 함수) 를 차례로 만들어냄
+# ------------------------------------------------------------------------------
+def scenario_main2(session, rng, steps):
+    for i in range(steps):
+        yield 'greet', lambda: (session.type_text('이름을 입력', f'학생{i}'), session.click('인사말 생성'))
+
+
+def scenario_mbti(session, rng, steps):
+    for _ in range(steps):
+        yield 'pick_type', lambda: session.select('MBTI 유형 선택', rng)
+
+
+def scenario_mbti02(session, rng, steps):
+    for _ in range(steps):
+        yield 'pick_country', lambda: session.select('country_select', rng)
+        yield 'pick_type', lambda: session.select('rank_type', rng)
+
+
+def scenario_maze(session, rng, steps):
+    for _ in range(steps):
+        yield 'generate', lambda: session.click('미로 생성')
+        yield 'resize', lambda: session.slide('미로 크기', rng.randint(5, 50))
+
+
+def scenario_library(session, rng, steps):
+    for _ in range(steps):
+        yield 'pick_type', lambda: session.select('lib_type', rng)
+        yield 'pick_category', lambda: session.select('lib_category', rng)
+        yield 'search', lambda: session.click('🔍 도서 검색')
+
+
+def scenario_minimizing(session, rng, steps):
+    words = ['신라면 20개입', '아이폰 케이스', '32인치 모니터', '생수 2L', '노트북 파우치']
+    for _ in range(steps):
+        yield 'search', lambda: session.type_text('', rng.choice(words))
+
+
+def scenario_rerun(session, rng, steps):
+    for _ in range(steps):
+        yield 'rerun', lambda: None
+
+
+SCENARIOS = {
+    'main2': scenario_main2,
+    'mbti': scenario_mbti,
+    'mbti02': scenario_mbti02,
+    'maze': scenario_maze,
+    'library': scenario_library,
+    'minimizing': scenario_minimizing,
+    'weather': scenario_rerun,
+    'weather02': scenario_rerun,
+}
+
+
+# ------------------------------------------------------------------------------
+# 서버 프로세스 + 웹소켓 세션 (브라우저 대신 BackMsg 를 보내고 script_finished 까지 ForwardMsg 를 읽음)
+# ------------------------------------------------------------------------------
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_app_server(timeout=60):
+    """streamlit run main2.py 를 띄우고 health 응답까지 대기 -> (Popen, port, 로그 파일 경로)"""
+    port = _free_port()
+    log_path = os.path.join(tempfile.mkdtemp(), 'streamlit.log')
+    with open(log_path, 'wb') as log:
+        proc = subprocess.Popen(
+            [sys.executable, '-m', 'streamlit', 'run', 'main2.py', '--server.headless', 'true',
+             '--server.address', '127.0.0.1', '--server.port', str(port),
+             '--server.fileWatcherType', 'none', '--browser.gatherUsageStats', 'false'],
+            cwd=ROOT, stdout=log, stderr=subprocess.STDOUT)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            break
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1)
+            return proc, port, log_path
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    with open(log_path, encoding='utf-8', errors='replace') as f:
+        raise RuntimeError(f"Streamlit 서버가 뜨지 않음:\n{f.read()[-2000:]}")
+
+
+def rss_mb(pid):
+    """/proc 기준 현재 RSS (리눅스 외에는 None)"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1e3
+    except OSError:
+        return None
+
+
+class RssWatcher:
+    """단계 동안 서버 프로세스 RSS 를 주기적으로 읽어 최댓값 기록"""
+
+    def __init__(self, pid, interval=0.1):
+        self.pid, self.interval = pid, interval
+        self.start_mb = self.peak_mb = rss_mb(pid)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            now = rss_mb(self.pid)
+            if now is not None:
+                self.peak_mb = max(self.peak_mb or 0.0, now)
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return self.start_mb, self.peak_mb
+
+
+class Session:
+    """웹소켓 연결 하나 = 브라우저 탭 하나"""
+
+    def __init__(self, ws, page, timeout):
+        self.ws, self.page, self.timeout = ws, page, timeout
+        self.widgets = {}        # (종류, 라벨) -> (위젯 proto, fragment id)
+        self.states = {}         # 위젯 id -> WidgetState (브라우저처럼 매번 전부 보냄)
+        self._triggers = []
+        self._fragments = set()
+
+    # --- 위젯 조작 (다음 rerun 에 실려 감) ---
+    def _widget(self, kind, name):
+        """name: 라벨 앞부분 또는 위젯 key"""
+        for (k, label), (proto, fragment_id) in self.widgets.items():
+            if k == kind and (label.startswith(name) or proto.id.endswith(f'-{name}')):
+                self._fragments.add(fragment_id)
+                return proto
+        raise LookupError(f"{self.page}: '{name}' {kind} 를 찾을 수 없음")
+
+    def _state(self, widget_id):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        state = WidgetState(id=widget_id)
+        self.states[widget_id] = state
+        return state
+
+    def select(self, prefix, rng):
+        proto = self._widget('selectbox', prefix)
+        self._state(proto.id).string_value = rng.choice(proto.options)
+
+    def slide(self, prefix, value):
+        self._state(self._widget('slider', prefix).id).double_array_value.data[:] = [value]
+
+    def type_text(self, prefix, text):
+        self._state(self._widget('text_input', prefix).id).string_value = text
+
+    def click(self, prefix):
+        self._triggers.append(self._widget('button', prefix).id)
+
+    # --- 실행 ---
+    async def rerun(self):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        msg = BackMsg()
+        msg.rerun_script.page_name = self.page
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        for widget_id in self._triggers:
+            msg.rerun_script.widget_states.widgets.append(WidgetState(id=widget_id, trigger_value=True))
+        # 바꾼 위젯이 모두 같은 fragment 안에 있으면 그 fragment 만 재실행 (브라우저와 같음)
+        if len(self._fragments) == 1:
+            msg.rerun_script.fragment_id = next(iter(self._fragments))
+        self._triggers, self._fragments = [], set()
+
+        await self.ws.send(msg.SerializeToString())
+        await asyncio.wait_for(self._read_until_finished(), self.timeout)
+
+    async def _read_until_finished(self):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        error = None
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await self.ws.recv())
+            kind = msg.WhichOneof('type')
+            if kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+                element = msg.delta.new_element
+                el_kind = element.WhichOneof('type')
+                if el_kind == 'exception':
+                    error = error or element.exception.message
+                elif el_kind in ('selectbox', 'slider', 'text_input', 'button'):
+                    proto = getattr(element, el_kind)
+                    self.widgets[(el_kind, proto.label)] = (proto, msg.delta.fragment_id)
+            elif kind == 'script_finished':
+                if msg.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue  # 스크립트가 st.rerun() 등으로 다시 시작
+                if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    error = error or 'compile error'
+                break
+        if error:
+            raise RuntimeError(error)
+
+
+# ------------------------------------------------------------------------------
+# 세션 실행 + 측정
+# ------------------------------------------------------------------------------
+async def run_session(port, page, steps, seed, timeout, start):
+    """세션 하나: 연결한 뒤 다른 세션들과 동시에 첫 화면 + 시나리오 실행 -> (samples, error)"""
+    import websockets
+
+    samples = []
+    try:
+        async with websockets.connect(f'ws://127.0.0.1:{port}/_stcore/stream', subprotocols=['streamlit'],
+                                      max_size=None, open_timeout=timeout) as ws:
+            session, rng = Session(ws, page, timeout), random.Random(seed)
+            await start.wait()
+
+            t = time.perf_counter()
+            await session.rerun()
+            samples.append((page, 'first_load', time.perf_counter() - t))
+
+            for action, interact in SCENARIOS[page](session, rng, steps):
+                interact()
+                t = time.perf_counter()
+                await session.rerun()
+                samples.append((page, action, time.perf_counter() - t))
+    except Exception as e:
+        return samples, f'{page}: {type(e).__name__}: {e}'
+    return samples, None
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        'count': len(values),
+        'p50': percentile(values, 0.50),
+        'p95': percentile(values, 0.95),
+        'p99': percentile(values, 0.99),
+        'mean': statistics.fmean(values) if values else 0.0,
+    }
+
+
+async def _run_sessions(port, n_sessions, pages, steps, seed, timeout):
+    start = asyncio.Event()
+    tasks = [asyncio.create_task(run_session(port, pages[i % len(pages)], steps, seed + i, timeout, start))
+             for i in range(n_sessions)]
+    await asyncio.sleep(0.5)  # 모든 세션이 연결된 뒤 동시에 시작
+    started = time.perf_counter()
+    start.set()
+    results = await asyncio.gather(*tasks)
+    return results, time.perf_counter() - started
+
+
+def run_stage(server, port, n_sessions, pages, steps, seed, timeout):
+    """동시 세션 n개를 페이지에 골고루 배정해서 같은 서버에 한꺼번에 접속"""
+    watcher = RssWatcher(server.pid)
+    results, wall = asyncio.run(_run_sessions(port, n_sessions, pages, steps, seed, timeout))
+    rss_start, rss_peak = watcher.stop()
+
+    samples = [s for session_samples, _ in results for s in session_samples]
+    errors = [error for _, error in results if error]
+
+    reruns = [s[2] for s in samples if s[1] != 'first_load']
+    per_page = {}
+    for page in pages:
+        per_page[page] = summarize([s[2] for s in samples if s[0] == page and s[1] != 'first_load'])
+        per_page[page]['first_load'] = summarize([s[2] for s in samples if s[0] == page and s[1] == 'first_load'])
+
+    return {
+        'sessions': n_sessions,
+        'wall_sec': wall,
+        'reruns_per_sec': len(reruns) / wall if wall else 0.0,
+        'rerun': summarize(reruns),
+        'pages': per_page,
+        'server_rss_start_mb': rss_start,
+        'server_rss_peak_mb': rss_peak,
+        'errors': errors,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 5, 10, 20], help='단계별 동시 세션 수')
+    parser.add_argument('--pages', nargs='+', default=PAGE_NAMES, choices=PAGE_NAMES)
+    parser.add_argument('--steps', type=int, default=5, help='세션당 시나리오 반복 횟수')
+    parser.add_argument('--seed', type=int, default=251218)
+    parser.add_argument('--timeout', type=float, default=120, help='rerun 한 번의 최대 시간(초)')
+    parser.add_argument('--target-p95', type=float, help='수용 인원 계산 기준 p95 지연(초)')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    standins = start_standins()  # 환경 변수로 서버 프로세스에 전달됨
+    server, port, log_path = start_app_server()
+
+    stages = []
+    print(f"{'sessions':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'rerun/s':>10}{'RSS(MB)':>10}  errors")
+    try:
+        for n in args.sessions:
+            stage = run_stage(server, port, n, args.pages, args.steps, args.seed, args.timeout)
+            stages.append(stage)
+            r, rss = stage['rerun'], stage['server_rss_peak_mb']
+            print(f"{n:>8}{r['p50'] * 1000:>10.0f}{r['p95'] * 1000:>10.0f}{r['p99'] * 1000:>10.0f}"
+                  f"{stage['reruns_per_sec']:>10.1f}{rss if rss is not None else float('nan'):>10.0f}"
+                  f"  {len(stage['errors'])}", flush=True)
+            for err in stage['errors'][:3]:
+                print(f"          ! {err}")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        standins.shutdown()
+
+    report = {'pages': args.pages, 'steps': args.steps, 'server_log': log_path, 'stages': stages}
+    if args.target_p95 is not None:
+        ok = [s['sessions'] for s in stages if s['rerun']['p95'] <= args.target_p95 and not s['errors']]
+        report['capacity'] = {'target_p95': args.target_p95, 'max_sessions': max(ok) if ok else 0}
+        print(f"\np95 <= {args.target_p95}s 를 만족하는 최대 동시 세션: {report['capacity']['max_sessions']}")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""스트리밍 미로(services/maze.py eller_rows / write_maze) 처리량 + 최대 메모리 측정
+
+    python -m benchmarks.maze_stream                          # 너비 1천/1만/2만 칸, 200줄, PNG
+    python -m benchmarks.maze_stream --widths 10000 --rows 1000 --format pbm
+    python -m benchmarks.maze_stream --widths 20000 --rows 20000 -o big.png   # 실제 파일로 저장
+
+처리량은 파일을 /dev/null(또는 -o 경로)에 쓰면서 측정하고, 메모리는 tracemalloc 오버헤드 때문에
+같은 너비로 짧게 한 번 더 실행해서 측정 (스트리밍이므로 최대 메모리는 줄 수와 무관)
+--compare 를 주면 기존 generate_maze(전체 격자를 메모리에 올림)의 최대 메모리도 같이 출력
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from services.maze import generate_maze, write_maze
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'maze_stream.json')
+SEED = 251218
+MEMORY_ROWS = 20
+
+
+def peak_memory_mb(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def bench_width(width, rows, fmt, loop_prob, path):
+    started = time.perf_counter()
+    with open(path or os.devnull, 'wb') as out:
+        write_maze(out, width, rows, loop_prob, seed=SEED, fmt=fmt)
+        written = out.tell() if path else None
+    elapsed = time.perf_counter() - started
+
+    def short_run():
+        with open(os.devnull, 'wb') as out:
+            write_maze(out, width, MEMORY_ROWS, loop_prob, seed=SEED, fmt=fmt)
+
+    return {
+        'width': width,
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_sec': rows / elapsed,
+        'cells_per_sec': width * rows / elapsed,
+        'bytes': written,
+        'peak_mb': peak_memory_mb(short_run),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--widths', type=int, nargs='+', default=[1000, 10000, 20000], help='미로 너비(칸)')
+    parser.add_argument('--rows', type=int, default=200, help='미로 높이(칸)')
+    parser.add_argument('--format', choices=['png', 'pbm'], default='png')
+    parser.add_argument('--loop-prob', type=float, default=0.4)
+    parser.add_argument('-o', '--output-file', help='미로 이미지를 저장할 경로 (없으면 버림)')
+    parser.add_argument('--compare', type=int, metavar='N', help='generate_maze(N) 최대 메모리도 측정')
+    parser.add_argument('--report', default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    print(f"{'width':>8}{'rows':>8}{'rows/s':>10}{'cells/s':>12}{'peak(MB)':>10}", flush=True)
+    results = []
+    for width in args.widths:
+        r = bench_width(width, args.rows, args.format, args.loop_prob, args.output_file)
+        results.append(r)
+        print(f"{width:>8}{args.rows:>8}{r['rows_per_sec']:>10.1f}{r['cells_per_sec']:>12,.0f}"
+              f"{r['peak_mb']:>10.2f}", flush=True)
+
+    report = {'format': args.format, 'loop_prob': args.loop_prob, 'stream': results}
+    if args.compare:
+        n = args.compare
+        started = time.perf_counter()
+        generate_maze(n, args.loop_prob, random.Random(SEED))
+        elapsed = time.perf_counter() - started
+        peak = peak_memory_mb(lambda: generate_maze(n, args.loop_prob, random.Random(SEED)))
+        report['generate_maze'] = {'grid': n, 'seconds': elapsed, 'rows_per_sec': n / elapsed, 'peak_mb': peak}
+        print(f"\ngenerate_maze({n}): {n / elapsed:.1f} rows/s, peak {peak:.1f} MB")
+
+    os.makedirs(os.path.dirname(args.report), exist_ok=True)
+    with open(args.report, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""weather02.py 기온 추세 그래프의 브라우저 렌더링 시간 측정용 HTML 생성
+
+    python -m benchmarks.plotly_render                 # benchmarks/results/plotly_render.html
+    python -m benchmarks.plotly_render --repeat 20 -o /tmp/render.html
+
+헤드리스 브라우저 없이도 측정할 수 있도록, plotly.js 와 그래프 스펙을 한 파일에 넣은 HTML 을 만듦
+브라우저로 열면 스펙마다 다음을 반복 측정해서 표로 보여줌 (결과는 콘솔에도 JSON 으로 출력)
+  - newPlot: 처음 그릴 때 (캐시가 없어 Figure 가 새로 만들어진 경우와 같음)
+  - react  : 같은 스펙으로 다시 그릴 때 (캐시된 Figure 를 다시 그린 경우 -> plotly 가 변경 없음으로 처리)
+스펙: 연평균 / 월평균 / 일별(WebGL) / 일별(SVG) - 서버 쪽 직렬화 시간과 크기도 같이 기록
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'plotly_render.html')
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>weather02 plotly render</title>
+<script>{plotlyjs}</script></head>
+<body><table border="1" id="result"><tr><th>spec</th><th>points</th><th>KB</th>
+<th>to_json(ms)</th><th>newPlot(ms)</th><th>react(ms)</th></tr></table>
+<div id="plot" style="width:1000px;height:500px"></div>
+<script>
+const SPECS = {specs};
+const REPEAT = {repeat};
+const median = xs => xs.slice().sort((a, b) => a - b)[Math.floor(xs.length / 2)];
+async function timeIt(fn) {{
+  const t = performance.now();
+  await fn();
+  await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));  // 실제 화면 반영까지
+  return performance.now() - t;
+}}
+(async () => {{
+  const out = {{}};
+  for (const s of SPECS) {{
+    const fresh = [], same = [];
+    for (let i = 0; i < REPEAT; i++) {{
+      Plotly.purge('plot');
+      fresh.push(await timeIt(() => Plotly.newPlot('plot', JSON.parse(s.spec))));
+      same.push(await timeIt(() => Plotly.react('plot', JSON.parse(s.spec))));
+    }}
+    out[s.name] = {{newPlot: median(fresh), react: median(same)}};
+    document.getElementById('result').insertAdjacentHTML('beforeend',
+      `<tr><td>${{s.name}}</td><td>${{s.points}}</td><td>${{(s.bytes / 1024).toFixed(0)}}</td>` +
+      `<td>${{(s.json_sec * 1000).toFixed(1)}}</td><td>${{out[s.name].newPlot.toFixed(1)}}</td>` +
+      `<td>${{out[s.name].react.toFixed(1)}}</td></tr>`);
+  }}
+  console.log(JSON.stringify(out));
+}})();
+</script></body></html>
+"""
+
+
+def build_specs():
+    from benchmarks.cases import _trend_inputs
+    from services.weather_charts import build_trend_figure
+
+    variants = [('year', None), ('month', None), ('day', True), ('day', False)]
+    specs = []
+    for resolution, webgl in variants:
+        fig = build_trend_figure(*_trend_inputs(resolution), webgl=webgl)
+        started = time.perf_counter()
+        spec = pio.to_json(fig, validate=False)
+        json_sec = time.perf_counter() - started
+        kind = '' if webgl is None else ('-webgl' if webgl else '-svg')
+        specs.append({
+            'name': resolution + kind,
+            'spec': spec,
+            'points': sum(len(t.x) for t in fig.data),
+            'bytes': len(spec),
+            'json_sec': json_sec,
+        })
+    return specs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10, help='스펙당 그리기 반복 횟수')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    specs = build_specs()
+    for s in specs:
+        print(f"{s['name']:<12}{s['points']:>8} points{s['bytes'] / 1024:>8.0f} KB"
+              f"{s['json_sec'] * 1000:>8.1f} ms to_json")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(PAGE.format(plotlyjs=get_plotlyjs(), specs=json.dumps(specs), repeat=args.repeat))
+    print(f"\n브라우저로 열어서 렌더링 시간 확인: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""페이지 계산 벤치마크 실행 + 기준(baseline) 대비 성능 저하 검사
+
+    python -m benchmarks.run                        # 기본(quick) 케이스, 결과: benchmarks/results/latest.json
+    python -m benchmarks.run --full                 # 큰 입력(maze 2000 등)까지
+    python -m benchmarks.run -k maze --repeat 10    # 이름에 'maze'가 들어간 케이스만
+    python -m benchmarks.run --save-baseline        # 이번 결과를 benchmarks/baseline.json 으로 저장
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.2
+
+기준 파일이 있으면 케이스별 중앙값을 비교해 threshold(기본 20%) 넘게 느려진 케이스가
+하나라도 있으면 종료 코드 1을 반환 (배포 전 확인용)
+기준 파일은 배포할 서버와 같은 사양의 머신에서 만들어야 의미가 있음
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks.cases import CASES
+
+BENCH_DIR = os.path.dirname(__file__)
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, 'results', 'latest.json')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+
+def measure(case, repeat, warmup=1, memory=False):
+    state = case.setup()
+    try:
+        for _ in range(warmup):
+            case.run(state)
+
+        samples = []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                case.run(state)
+                samples.append(time.perf_counter() - started)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        result = {
+            'repeat': repeat,
+            'median': statistics.median(samples),
+            'min': min(samples),
+            'mean': statistics.fmean(samples),
+            'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        }
+
+        # 메모리는 tracemalloc 오버헤드가 커서 시간 측정과 따로 한 번만 실행
+        if memory:
+            tracemalloc.start()
+            case.run(state)
+            result['peak_mb'] = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+        return result
+    finally:
+        case.teardown(state)
+
+
+def environment():
+    import numpy
+    import pandas
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+    }
+
+
+def compare(results, baseline, threshold):
+    """(표 문자열, 느려진 케이스 이름 목록)"""
+    lines = [f"{'case':<28}{'baseline(ms)':>14}{'now(ms)':>12}{'change':>10}"]
+    regressions = []
+    for name, now in results.items():
+        base = baseline.get('results', {}).get(name)
+        if base is None:
+            lines.append(f"{name:<28}{'-':>14}{now['median'] * 1000:>12.2f}{'new':>10}")
+            continue
+        ratio = now['median'] / base['median'] if base['median'] else float('inf')
+        flag = ''
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = '  <-- 느려짐'
+        lines.append(f"{name:<28}{base['median'] * 1000:>14.2f}{now['median'] * 1000:>12.2f}"
+                     f"{(ratio - 1) * 100:>+9.1f}%{flag}")
+    return '\n'.join(lines), regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', '--filter', default='', help='이름에 이 문자열이 들어간 케이스만 실행')
+    parser.add_argument('--full', action='store_true', help="'full' 프로필(큰 입력) 케이스도 실행")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--memory', action='store_true', help='케이스별 최대 메모리(tracemalloc)도 기록')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=0.2, help='허용하는 중앙값 증가율 (0.2 = 20%%)')
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    cases = [c for c in CASES if args.filter in c.name and (args.full or c.profile == 'quick')]
+    results = {}
+    for case in cases:
+        # 큰 케이스는 반복 횟수를 줄임
+        repeat = 1 if case.profile == 'full' else args.repeat
+        results[case.name] = measure(case, repeat, warmup=0 if case.profile == 'full' else 1, memory=args.memory)
+        extra = f"  peak {results[case.name]['peak_mb']:.1f}MB" if args.memory else ''
+        print(f"{case.name:<28}{results[case.name]['median'] * 1000:>10.2f} ms{extra}", flush=True)
+
+    report = {'meta': environment(), 'results': results}
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n기준 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n기준 파일 없음 ({args.baseline}) - 비교 생략")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    table, regressions = compare(results, baseline, args.threshold)
+    print('\n' + table)
+    if regressions:
+        print(f"\n성능 저하 {len(regressions)}건: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from services.mbti_data import MBTI_CSV_PATH
+from services.weather_data import WEATHER_CSV_PATH
+
+# ------------------------------------------------------------------------------
+# 번들 데이터를 키운 합성 입력 (시드 고정 -> 실행할 때마다 같은 데이터)
+# ------------------------------------------------------------------------------
+SEED = 251218
+
+
+def scaled_weather_csv(out_dir, stations=20):
+    """번들 일별 기온 CSV를 지점 수만큼 복제 (지점별로 약간의 기온 차이) -> 파일 경로"""
+    path = os.path.join(out_dir, f'weather_{stations}.csv')
+    if os.path.exists(path):
+        return path
+
+    rng = np.random.default_rng(SEED)
+    base = pd.read_csv(WEATHER_CSV_PATH, encoding='utf-8')
+    base.columns = base.columns.str.strip()
+    temp_cols = [c for c in base.columns if '기온' in c]
+
+    frames = []
+    for i in range(stations):
+        frame = base.copy()
+        frame['지점'] = 100 + i
+        offset = rng.normal(0, 2)
+        for col in temp_cols:
+            frame[col] = pd.to_numeric(frame[col], errors='coerce') + offset
+        frames.append(frame)
+    pd.concat(frames, ignore_index=True).to_csv(path, index=False, encoding='utf-8')
+    return path
+
+
+def scaled_mbti(countries=10000):
+    """번들 MBTI 데이터 형식 그대로 국가 수만 늘린 DataFrame (행마다 비율 합 1)"""
+    rng = np.random.default_rng(SEED)
+    columns = pd.read_csv(MBTI_CSV_PATH, nrows=0).columns[1:]
+    values = rng.dirichlet(np.ones(len(columns)) * 5, size=countries)
+    df = pd.DataFrame(values, columns=columns)
+    df.insert(0, 'Country', [f'Country {i:05d}' for i in range(countries - 1)] + ['대한민국'])
+    return df
+
+
+def library_catalog(rows=500_000):
+    """서초구 전자도서관 시트와 비슷한 컬럼 구성의 합성 카탈로그"""
+    rng = np.random.default_rng(SEED)
+    types = ['전자책', '오디오북', '웹소설', '전자잡지']
+    categories = ['총류', '철학', '종교', '사회과학', '자연과학', '기술과학', '예술', '언어', '문학', '역사',
+                  '아동', '청소년', '경제경영', '자기계발', '컴퓨터']
+    ids = np.arange(rows)
+    return pd.DataFrame({
+        '번호': ids,
+        '서명': [f'합성 도서 {i}' for i in ids],
+        '저자': [f'저자 {i % 5000}' for i in ids],
+        '출판사': [f'출판사 {i % 800}' for i in ids],
+        '발행년도': rng.integers(1990, 2026, rows),
+        '자료유형': rng.choice(types, rows, p=[0.6, 0.2, 0.15, 0.05]),
+        '분야': rng.choice(categories, rows),
+        '표지이미지': [f'https://example.invalid/cover/{i}.jpg' for i in ids],
+    })
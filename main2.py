@@ -1,6 +1,13 @@
 import streamlit as st
+from services.datasets import start_server_prewarm
+
 st.title('나의 첫 웹 서비스 만들기!!')
 name = st.text_input('이름을 입력해주세요 : ')
 menu = st.selectbox('좋아하는 음식을 선택해주세요:', ['망고빙수','아몬드봉봉'])
 if st.button('인사말 생성') : 
     st.write(name+'님! 당신이 좋아하는 음식은 '+menu+'이군요?! 저도 좋아요!!')
+
+# 서버가 뜬 뒤 첫 접속 때 한 번만: 무거운 라이브러리, 한글 폰트, 모든 페이지 데이터셋을
+# 백그라운드에서 미리 준비 (이미 시작했으면 그대로)
+# 화면을 다 그린 뒤에 시작해야 첫 화면이 워밍업 스레드와 GIL 을 나눠 쓰지 않음
+start_server_prewarm()
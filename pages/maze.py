@@ -1,7 +1,9 @@
 import streamlit as st
-import random
 import matplotlib.pyplot as plt
 import numpy as np
+import io
+from services.maze import generate_maze, write_maze
+from services.metrics import show_debug_sidebar, timed
 
 # ----------------------------------------------------
 # 1. 설정 및 UI 구성 (Pygame 대체)
@@ -18,112 +20,29 @@ with st.sidebar:
     LOOP_PROB = st.slider("루프 생성 확률 (Braid)", 0.0, 1.0, 0.4)
     btn_generate = st.button("미로 생성 (Generate)")
 
-# ----------------------------------------------------
-# 2. 미로 생성 로직 (기존 로직 유지)
-# ----------------------------------------------------
-def generate_maze(grid_size, loop_prob):
-    # 초기화
-    parent = {}
-    rank = {}
-
-    def find(x):
-        if parent[x] != x:
-            parent[x] = find(parent[x])
-        return parent[x]
-
-    def union(a, b):
-        ra = find(a)
-        rb = find(b)
-        if ra == rb:
-            return False
-        if rank[ra] < rank[rb]:
-            parent[ra] = rb
-        else:
-            parent[rb] = ra
-            if rank[ra] == rank[rb]:
-                rank[ra] += 1
-        return True
-
-    for r in range(grid_size):
-        for c in range(grid_size):
-            parent[(r, c)] = (r, c)
-            rank[(r, c)] = 0
-
-    walls = []
-    for r in range(grid_size):
-        for c in range(grid_size):
-            if r + 1 < grid_size:
-                walls.append(((r, c), (r + 1, c)))
-            if c + 1 < grid_size:
-                walls.append(((r, c), (r, c + 1)))
-
-    random.shuffle(walls)
-
-    vertical = [[True] * (grid_size - 1) for _ in range(grid_size)]
-    horizontal = [[True] * grid_size for _ in range(grid_size - 1)]
-
-    # Kruskal 벽 제거
-    for a, b in walls:
-        if union(a, b):
-            r1, c1 = a
-            r2, c2 = b
-            if r1 == r2:  # 세로 벽
-                vertical[r1][min(c1, c2)] = False
-            else:         # 가로 벽
-                horizontal[min(r1, r2)][c1] = False
-
-    # Dead-end 제거 (Braid)
-    def count_open(r, c):
-        cnt = 0
-        if r > 0 and not horizontal[r - 1][c]: cnt += 1
-        if r < grid_size - 1 and not horizontal[r][c]: cnt += 1
-        if c > 0 and not vertical[r][c - 1]: cnt += 1
-        if c < grid_size - 1 and not vertical[r][c]: cnt += 1
-        return cnt
-
-    for r in range(grid_size):
-        for c in range(grid_size):
-            if count_open(r, c) == 1:
-                if random.random() < loop_prob:
-                    dirs = []
-                    if r > 0: dirs.append(("U", r - 1, c))
-                    if r < grid_size - 1: dirs.append(("D", r + 1, c))
-                    if c > 0: dirs.append(("L", r, c - 1))
-                    if c < grid_size - 1: dirs.append(("R", r, c + 1))
-
-                    if dirs:
-                        d, nr, nc = random.choice(dirs)
-                        if d == "U": horizontal[r - 1][c] = False
-                        elif d == "D": horizontal[r][c] = False
-                        elif d == "L": vertical[r][c - 1] = False
-                        elif d == "R": vertical[r][c] = False
-
-    # 타일 맵 생성 (1=벽, 0=통로)
-    maze_map = [[1] * (grid_size * 2 + 1) for _ in range(grid_size * 2 + 1)]
-
-    for r in range(grid_size):
-        for c in range(grid_size):
-            maze_map[r*2+1][c*2+1] = 0
-
-    for r in range(grid_size):
-        for c in range(grid_size - 1):
-            if not vertical[r][c]:
-                maze_map[r*2+1][c*2+2] = 0
-
-    for r in range(grid_size - 1):
-        for c in range(grid_size):
-            if not horizontal[r][c]:
-                maze_map[r*2+2][c*2+1] = 0
-    
-    return maze_map
+    # 인쇄용 큰 미로: 한 줄씩 만들어 바로 PNG로 압축 (화면에는 그리지 않음)
+    st.divider()
+    st.subheader("인쇄용 큰 미로 (PNG)")
+    BIG_W = st.number_input("너비 (칸)", 50, 2000, 300, step=50)
+    BIG_H = st.number_input("높이 (칸)", 50, 2000, 300, step=50)
+    SEED = st.number_input("시드 (같은 시드 = 같은 미로)", 0, 2**31 - 1, 0)
+    if st.button("PNG 만들기"):
+        buf = io.BytesIO()
+        with timed('maze.stream'):
+            write_maze(buf, BIG_W, BIG_H, LOOP_PROB, seed=SEED, fmt='png')
+        st.session_state.big_maze = buf.getvalue()
+    if 'big_maze' in st.session_state:
+        st.download_button("⬇️ 미로 PNG 다운로드", st.session_state.big_maze,
+                           file_name="maze.png", mime="image/png")
 
 # ----------------------------------------------------
-# 3. 그리기 및 실행 (Matplotlib 사용)
+# 2. 미로 생성(services/maze.py) 및 그리기 (Matplotlib 사용)
 # ----------------------------------------------------
 
 # 세션 상태를 사용하여 불필요한 재생성 방지
 if 'maze' not in st.session_state or btn_generate:
-    st.session_state.maze = generate_maze(GRID, LOOP_PROB)
+    with timed('maze.generate'):
+        st.session_state.maze = generate_maze(GRID, LOOP_PROB)
 
 # 시각화
 maze_data = np.array(st.session_state.maze)
@@ -137,7 +56,11 @@ fig, ax = plt.subplots(figsize=(10, 10))
 # 데이터 반전: 1(벽) -> 0(검정), 0(길) -> 1(흰색)
 display_data = 1 - maze_data 
 
-ax.imshow(display_data, cmap='gray', interpolation='nearest')
+with timed('maze.draw'):
+    ax.imshow(display_data, cmap='gray', interpolation='nearest')
 ax.axis('off')  # 축 숨기기
 
-st.pyplot(fig)
+with timed('maze.pyplot'):
+    st.pyplot(fig)
+
+show_debug_sidebar('maze.')
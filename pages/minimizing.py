@@ -1,4 +1,6 @@
 import streamlit as st
+from services.metrics import show_debug_sidebar, timed
+from services.query import QueryLog, clean_query, normalize_query
 
 # 페이지 기본 설정
 st.set_page_config(
@@ -7,10 +9,25 @@ st.set_page_config(
     layout="wide"  # 버튼이 5개라 넓은 화면 사용
 )
 
+# 5개 쇼핑몰 동시 검색기 (서버 전체에서 하나만 만들어 커넥션 풀/캐시 공유)
+@st.cache_resource
+def get_aggregator():
+    # httpx 는 첫 검색 때만 불러옴 (검색 전 첫 화면을 가볍게)
+    from services.price_search import PriceAggregator
+    return PriceAggregator(cache_ttl=300)
+
+# 검색 기록 + 자동완성 트라이 (서버 전체 공유)
+@st.cache_resource
+def get_query_log():
+    return QueryLog()
+
+def use_suggestion(text):
+    st.session_state.keyword = text
+
 # 제목 및 설명
 st.title("🛒 쇼핑몰 통합 최저가 검색기")
 st.markdown("""
-원하는 상품명을 입력하면 **5대 쇼핑몰**의 최저가 페이지를 한 번에 열 수 있습니다.
+원하는 상품명을 입력하면 **5대 쇼핑몰**의 최저가 페이지를 한 번에 열고, 가격을 한 표로 비교할 수 있습니다.
 """)
 st.divider()
 
@@ -19,56 +36,81 @@ st.divider()
 keyword = st.text_input(
     label="검색할 상품명을 입력하세요",
     placeholder="예: 신라면 20개입, 아이폰 케이스, 32인치 모니터...",
-    help="상품명을 구체적으로 적을수록 정확도가 올라갑니다."
+    help="상품명을 구체적으로 적을수록 정확도가 올라갑니다.",
+    key="keyword"
 )
 
+# 자동완성: 다른 사용자들이 많이 검색한 비슷한 검색어
+if keyword:
+    suggestions = [q for q in get_query_log().suggest(keyword) if q != normalize_query(keyword)]
+    if suggestions:
+        st.caption("🔎 이런 검색어는 어떠세요?")
+        sug_cols = st.columns(len(suggestions))
+        for col, text in zip(sug_cols, suggestions):
+            col.button(text, key=f"sug_{text}", on_click=use_suggestion, args=(text,))
+
 # 2. 검색어가 있을 때만 버튼 생성
 if keyword:
-    # URL 생성을 위한 문자열 처리 (공백을 +로 치환)
-    # 별도 라이브러리 없이 브라우저 호환성을 위해 처리
-    query = keyword.strip().replace(" ", "+")
+    # 쇼핑몰에는 사용자가 입력한 검색어를 공백만 정리해서 그대로 보내고,
+    # 정규화한 검색어('신라면20 개입' -> '신라면 20개입')는 캐시 키 / 검색 기록에만 사용
+    cleaned = clean_query(keyword)
+    normalized = normalize_query(keyword)
+
+    # 세션에서 새로 검색한 검색어만 기록 (rerun마다 중복 기록 방지)
+    if normalized and st.session_state.get("last_logged") != normalized:
+        get_query_log().record(normalized)
+        st.session_state.last_logged = normalized
     
     st.subheader(f"🔍 '{keyword}' 최저가 검색 결과")
     st.caption("아래 버튼을 누르면 각 사이트의 '낮은 가격순' 정렬 페이지가 새 탭에서 열립니다.")
     st.write("") # 여백
 
-    # --- 각 쇼핑몰별 최저가 정렬 URL 패턴 ---
-    
-    # 1) 쿠팡: sorter=salePriceAsc
-    url_coupang = f"https://www.coupang.com/np/search?component=&q={query}&channel=user&sorter=salePriceAsc"
-    
-    # 2) G마켓: s=1 (낮은 가격순)
-    url_gmarket = f"https://browse.gmarket.co.kr/search?keyword={query}&s=1"
-    
-    # 3) 11번가: sortCd=L (Low Price)
-    url_st11 = f"https://search.11st.co.kr/Search.tmall?kwd={query}&sortCd=L"
-    
-    # 4) 롯데홈쇼핑: s_rank=3 (낮은 가격순)
-    url_lotte = f"https://www.lotteimall.com/search/searchMain.lotte?headerQuery={query}&s_rank=3"
-    
-    # 5) 옥션: s=8 (낮은 가격순)
-    url_auction = f"http://browse.auction.co.kr/search?keyword={query}&s=8"
-
     # --- 버튼 배치 (5개 나란히) ---
-    col1, col2, col3, col4, col5 = st.columns(5)
-
-    with col1:
-        st.link_button("🚀 쿠팡", url_coupang, use_container_width=True)
-        
-    with col2:
-        st.link_button("🟢 G마켓", url_gmarket, use_container_width=True)
-        
-    with col3:
-        st.link_button("🔴 11번가", url_st11, use_container_width=True)
-        
-    with col4:
-        st.link_button("🛍️ 롯데홈쇼핑", url_lotte, use_container_width=True)
-        
-    with col5:
-        st.link_button("🟡 옥션", url_auction, use_container_width=True)
+    # 각 쇼핑몰의 '낮은 가격순' 검색 URL 은 가격 조회와 같은 어댑터에서 만듦 (services/price_search.py)
+    adapters = get_aggregator().adapters
+    for col, adapter in zip(st.columns(len(adapters)), adapters):
+        with col:
+            st.link_button(adapter.label, adapter.search_url(cleaned), use_container_width=True)
+
+    # --- 5개 쇼핑몰 동시 조회 후 가격순 통합 표 ---
+    st.write("")
+    st.subheader("📋 통합 가격 비교 (낮은 가격순)")
+
+    # 정규화 후 남는 글자가 없으면 (기호만 입력) 가격 조회는 건너뜀
+    merged, shop_status = [], []
+    if normalized:
+        with st.spinner("5개 쇼핑몰을 동시에 조회하는 중..."):
+            with timed('minimizing.search'):
+                merged, shop_status = get_aggregator().search(cleaned, key=normalized)
+
+    if merged:
+        st.dataframe(
+            merged,
+            column_config={
+                "shop": "쇼핑몰",
+                "title": "상품명",
+                "price": st.column_config.NumberColumn("가격(원)", format="%d"),
+                "url": st.column_config.LinkColumn("링크"),
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+    else:
+        st.warning("가격 정보를 가져오지 못했습니다. 위 버튼으로 각 사이트를 직접 확인해주세요.")
+
+    if shop_status:
+        with st.expander("쇼핑몰별 응답 상태"):
+            st.dataframe(
+                [{"쇼핑몰": s["shop"], "상태": s["status"], "상품 수": s["count"],
+                  "응답 시간(초)": round(s["elapsed"], 2)} for s in shop_status],
+                hide_index=True,
+                use_container_width=True
+            )
 
     st.success("팁: 배송비를 포함한 실제 가격은 각 사이트 옵션을 확인하세요!")
 
 else:
     # 검색어가 없을 때 보이는 안내 문구
     st.info("👆 위 입력창에 찾으시는 물건을 입력하고 Enter를 눌러주세요.")
+
+show_debug_sidebar('minimizing.')
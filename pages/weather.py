@@ -1,6 +1,7 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
+from services.datasets import get_dataset
+from services.metrics import show_debug_sidebar, timed
 
 # --------------------------------------------------------------------------------
 # 1. 페이지 설정
@@ -11,54 +12,17 @@ st.title("🌡️ 기온 데이터 분석 및 평균 기온 추세선")
 # --------------------------------------------------------------------------------
 # 2. 데이터 로드 및 전처리
 # --------------------------------------------------------------------------------
-filename = 'pages/ta_20251213130855.csv'
-
-@st.cache_data
-def load_and_process_data(file_path):
+# 일별 원본 정제 + 연도별 집계는 공용 레지스트리가 서버 전체에서 한 번만 수행
+def load_and_process_data():
     try:
-        # csv 파일 읽기 (한글 인코딩 cp949)
-        # os.path.exists 대신 try-except 구문으로 파일 없음 에러 처리
-        df = pd.read_csv(file_path, encoding='utf-8')
-        
-        # 컬럼명 공백 제거
-        df.columns = df.columns.str.strip()
-        
-        # '날짜' 컬럼 전처리
-        if '날짜' in df.columns:
-            df['날짜'] = df['날짜'].astype(str).str.replace('\t', '').str.replace('"', '').str.strip()
-            df['날짜'] = pd.to_datetime(df['날짜'], errors='coerce')
-        
-        # 연도 추출
-        df['Year'] = df['날짜'].dt.year
-        
-        # 숫자형 변환
-        cols_to_numeric = ['평균기온(℃)', '최저기온(℃)', '최고기온(℃)']
-        for col in cols_to_numeric:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-
-        # 결측치 제거
-        df = df.dropna(subset=['Year'] + cols_to_numeric)
-        df['Year'] = df['Year'].astype(int)
-
-        # 연도별 집계
-        yearly_df = df.groupby('Year').agg({
-            '평균기온(℃)': 'mean',
-            '최저기온(℃)': 'min', 
-            '최고기온(℃)': 'max'
-        }).reset_index()
-
-        # 컬럼 이름 영문 변경 (Streamlit 차트 범례용)
-        yearly_df.columns = ['Year', 'Avg_Temp', 'Abs_Min_Temp', 'Abs_Max_Temp']
-        
-        return yearly_df, None
-
+        return get_dataset('weather_yearly_extremes'), None
     except FileNotFoundError:
         return None, "파일을 찾을 수 없습니다. 경로를 확인해주세요."
     except Exception as e:
         return None, f"데이터 처리 중 오류 발생: {e}"
 
 # 데이터 불러오기
-df, error_msg = load_and_process_data(filename)
+df, error_msg = load_and_process_data()
 
 if error_msg:
     st.error(error_msg)
@@ -71,9 +35,11 @@ x = df['Year']
 y = df['Avg_Temp']
 
 # 1차 방정식 계산
-slope, intercept = np.polyfit(x, y, 1)
+with timed('weather.polyfit'):
+    slope, intercept = np.polyfit(x, y, 1)
 trend_poly = np.poly1d((slope, intercept))
-df['Trend_Line'] = trend_poly(x)
+# 공유 데이터는 직접 수정하지 않고 추세선 열을 붙인 새 DataFrame 사용
+df = df.assign(Trend_Line=trend_poly(x))
 
 # --------------------------------------------------------------------------------
 # 4. 화면 출력 (KPI)
@@ -98,10 +64,13 @@ chart_data = df.set_index('Year')[['Abs_Min_Temp', 'Abs_Max_Temp', 'Avg_Temp', '
 
 # Streamlit 내장 라인 차트 사용 (Matplotlib 대체)
 # 색상은 Streamlit이 자동으로 지정하지만, color 파라미터로 지정 가능
-st.line_chart(
-    chart_data,
-    color=["#0000FF", "#008000", "#000000", "#FF0000"], # 파랑(최저), 초록(최고), 검정(평균), 빨강(추세)
-    height=500
-)
+with timed('weather.line_chart'):
+    st.line_chart(
+        chart_data,
+        color=["#0000FF", "#008000", "#000000", "#FF0000"], # 파랑(최저), 초록(최고), 검정(평균), 빨강(추세)
+        height=500
+    )
 
 st.info("※ 차트 범례: Abs_Min(파랑), Abs_Max(초록), Avg(검정), Trend_Line(빨강). 차트 위에 마우스를 올리면 상세 수치를 확인할 수 있습니다.")
+
+show_debug_sidebar('weather.')
@@ -0,0 +1 @@
+"""여러 페이지(pages/)에서 함께 쓰는 계산/데이터 로직 모음"""
@@ -0,0 +1,330 @@
+import hashlib
+import json
+import math
+import threading
+import traceback
+from collections import OrderedDict
+
+from services.datasets import get_dataset, registry
+from services.metrics import count_cache, timed
+
+# ------------------------------------------------------------------------------
+# 대시보드 계산 결과를 JSON으로 돌려주는 조회 API (HTTP 서버: tools/api_server.py)
+# ------------------------------------------------------------------------------
+# - 모든 값은 Streamlit 페이지와 같은 데이터셋 레지스트리에서 읽음 (같은 로더, 같은 사전 계산)
+# - 응답 본문은 (경로, 파라미터)별로 캐시하고, 사용한 데이터셋의 버전이 바뀌면 다시 만듦
+# - ETag 는 응답 본문 해시 -> 데이터를 다시 읽었어도 결과가 같으면 304 로 끝남
+# - 여러 지점/국가/유형은 쉼표로 한 번에 (station=108,119) 또는 /batch 로 여러 요청을 한 번에
+MAX_BATCH = 200
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Endpoint:
+    def __init__(self, path, handler, datasets=(), cacheable=True, description=''):
+        self.path = path
+        self.handler = handler
+        self.datasets = tuple(datasets)   # 결과가 의존하는 데이터셋 (버전이 캐시 키에 들어감)
+        self.cacheable = cacheable
+        self.description = description
+
+
+ENDPOINTS = {}
+
+
+def endpoint(path, datasets=(), cacheable=True):
+    def decorator(func):
+        ENDPOINTS[path] = Endpoint(path, func, datasets, cacheable, (func.__doc__ or '').strip())
+        return func
+    return decorator
+
+
+# ------------------------------------------------------------------------------
+# 파라미터 / 값 변환
+# ------------------------------------------------------------------------------
+def _list(params, key):
+    """'108,119' -> ['108', '119'] (없으면 빈 리스트)"""
+    return [v.strip() for v in params.get(key, '').split(',') if v.strip()]
+
+
+def _int(params, key, default):
+    try:
+        return int(params.get(key, default))
+    except ValueError:
+        raise ApiError(400, f"'{key}' 는 정수여야 합니다")
+
+
+def _stations(params, available):
+    names = _list(params, 'station')
+    if not names:
+        return sorted(available)
+    try:
+        stations = [int(s) for s in names]
+    except ValueError:
+        raise ApiError(400, "'station' 은 지점 번호(정수)여야 합니다")
+    missing = [s for s in stations if s not in available]
+    if missing:
+        raise ApiError(404, f"없는 지점: {missing}")
+    return stations
+
+
+def _records(df):
+    """DataFrame -> JSON 레코드 (NaN 은 null)"""
+    return [{k: _clean(v) for k, v in row.items()} for row in df.to_dict('records')]
+
+
+def _clean(value):
+    if hasattr(value, 'item'):  # numpy 스칼라
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _require_library():
+    facets = get_dataset('library_facets')
+    if facets is None:
+        raise ApiError(503, "도서관 카탈로그를 불러올 수 없습니다")
+    return facets
+
+
+# ------------------------------------------------------------------------------
+# 엔드포인트
+# ------------------------------------------------------------------------------
+@endpoint('/health', cacheable=False)
+def health(params):
+    """서버 상태"""
+    return {'ok': True}
+
+
+@endpoint('/endpoints', cacheable=False)
+def list_endpoints(params):
+    """사용 가능한 경로 목록"""
+    return {path: ep.description for path, ep in ENDPOINTS.items()}
+
+
+@endpoint('/datasets', cacheable=False)
+def datasets(params):
+    """데이터셋 레지스트리 상태 (로드 여부, 나이, 버전)"""
+    return {'datasets': registry.status()}
+
+
+@endpoint('/weather/stations', datasets=['weather_station_trends'])
+def weather_stations(params):
+    """관측 지점 목록 + 관측 기간"""
+    trends = get_dataset('weather_station_trends')
+    return {'stations': [{k: t[k] for k in ('station', 'first_year', 'last_year', 'years')}
+                         for t in trends.values()]}
+
+
+@endpoint('/weather/yearly', datasets=['weather_by_station'])
+def weather_yearly(params):
+    """지점별 연평균 평균/최저/최고 기온 (station=108,119 / 생략하면 전체 지점)"""
+    by_station = get_dataset('weather_by_station')
+    return {'stations': {str(s): _records(by_station[s]) for s in _stations(params, by_station)}}
+
+
+@endpoint('/weather/trend', datasets=['weather_station_trends'])
+def weather_trend(params):
+    """지점별 기온 추세 (기울기, 100년당 상승폭, 총 상승폭)"""
+    trends = get_dataset('weather_station_trends')
+    return {'stations': {str(s): trends[s] for s in _stations(params, trends)}}
+
+
+@endpoint('/mbti/types', datasets=['mbti'])
+def mbti_types(params):
+    """MBTI 유형(32개)과 국가 목록"""
+    df = get_dataset('mbti')
+    return {'types': list(df.columns[1:]), 'countries': df['Country'].tolist()}
+
+
+@endpoint('/mbti/rank', datasets=['mbti', 'mbti_ranks'])
+def mbti_rank(params):
+    """유형별 상위 국가 (type=INTJ-A,ENFP-T&top=10&focus=대한민국)"""
+    df = get_dataset('mbti')
+    ranks = get_dataset('mbti_ranks')
+    types = _list(params, 'type')
+    if not types:
+        raise ApiError(400, "'type' 파라미터가 필요합니다")
+    missing = [t for t in types if t not in ranks.columns]
+    if missing:
+        raise ApiError(404, f"없는 유형: {missing}")
+
+    top_n = _int(params, 'top', 10)
+    focus = params.get('focus', '대한민국')
+    result = {}
+    for mbti_type in types:
+        top = df[['Country', mbti_type]].nlargest(top_n, mbti_type)
+        result[mbti_type] = {
+            'top': [{'country': c, 'ratio': _clean(v)} for c, v in zip(top['Country'], top[mbti_type])],
+            'focus': None if focus not in ranks.index else {
+                'country': focus,
+                'ratio': _clean(df.loc[df['Country'] == focus, mbti_type].iloc[0]),
+                'rank': int(ranks.at[focus, mbti_type]),
+            },
+        }
+    return {'types': result}
+
+
+@endpoint('/mbti/country', datasets=['mbti', 'mbti_ranks', 'mbti_rollups'])
+def mbti_country(params):
+    """국가별 32유형 비율 + 세계 순위 + 묶음 합계 (country=대한민국,일본)"""
+    df = get_dataset('mbti')
+    ranks = get_dataset('mbti_ranks')
+    rollups = get_dataset('mbti_rollups')
+    countries = _list(params, 'country')
+    if not countries:
+        raise ApiError(400, "'country' 파라미터가 필요합니다")
+    missing = [c for c in countries if c not in ranks.index]
+    if missing:
+        raise ApiError(404, f"없는 국가: {missing}")
+
+    ratios = df.set_index('Country')
+    result = {}
+    for country in countries:
+        result[country] = {
+            'ratio': {t: _clean(v) for t, v in ratios.loc[country].items()},
+            'rank': {t: int(v) for t, v in ranks.loc[country].items()},
+            'rollups': {name: {g: _clean(v) for g, v in table.loc[country].items()}
+                        for name, table in rollups.items()},
+        }
+    return {'countries': result}
+
+
+@endpoint('/library/facets', datasets=['library_facets'])
+def library_facets(params):
+    """자료유형별 권수 + 유형 안의 분야별 권수 (type=전자책,오디오북 / 생략하면 전체)"""
+    facets = _require_library()
+    table = facets['table']
+    types = _list(params, 'type') or ['전체']
+    missing = [t for t in types if t != '전체' and t not in table.index]
+    if missing:
+        raise ApiError(404, f"없는 자료유형: {missing}")
+
+    def categories(t):
+        counts = table.sum(axis=0) if t == '전체' else table.loc[t]
+        return {str(c): int(n) for c, n in counts.items() if n}
+
+    return {
+        'type_column': facets['type_column'],
+        'category_column': facets['category_column'],
+        'total': int(table.to_numpy().sum()),
+        'types': {str(t): int(n) for t, n in table.sum(axis=1).items()},
+        'categories': {t: categories(t) for t in types},
+    }
+
+
+# ------------------------------------------------------------------------------
+# 응답 캐시 + 요청 처리
+# ------------------------------------------------------------------------------
+class ResponseCache:
+    """(경로, 파라미터) -> (데이터셋 버전, ETag, 본문) LRU (maxsize=0 이면 캐시 안 함)"""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, versions):
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None or hit[0] != versions:
+                return None
+            self._data.move_to_end(key)
+            return hit[1], hit[2]
+
+    def set(self, key, versions, etag, body):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (versions, etag, body)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+cache = ResponseCache()
+
+
+def make_etag(body):
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def encode(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def call_handler(ep, params):
+    """핸들러 실행 - 예상하지 못한 오류(pandas 등)도 ApiError(500)으로 바꿔서 항상 JSON 응답이 나가게 함"""
+    try:
+        return ep.handler(params)
+    except ApiError:
+        raise
+    except Exception as e:
+        traceback.print_exc()
+        raise ApiError(500, f"서버 내부 오류: {type(e).__name__}")
+
+
+def handle(path, params):
+    """GET 한 건 처리 -> (ETag, JSON 본문 bytes) / 실패 시 ApiError"""
+    ep = ENDPOINTS.get(path)
+    if ep is None:
+        raise ApiError(404, f"없는 경로: {path}")
+
+    try:
+        versions = tuple(registry.version(name) for name in ep.datasets)
+    except (OSError, ValueError) as e:
+        raise ApiError(503, f"데이터를 불러올 수 없습니다: {e}")
+
+    key = (path, tuple(sorted(params.items())))
+    if ep.cacheable:
+        hit = cache.get(key, versions)
+        count_cache('api.response', hit is not None)
+        if hit is not None:
+            return hit
+
+    with timed(f'api{path}'):
+        body = encode(call_handler(ep, params))
+    etag = make_etag(body)
+    if ep.cacheable:
+        cache.set(key, versions, etag, body)
+    return etag, body
+
+
+def handle_batch(requests):
+    """[{'path': ..., 'params': {...}}, ...] -> 응답 목록 JSON bytes (각 본문은 다시 직렬화하지 않고 그대로 이어붙임)"""
+    if not isinstance(requests, list):
+        raise ApiError(400, "'requests' 는 목록이어야 합니다")
+    if len(requests) > MAX_BATCH:
+        raise ApiError(413, f"한 번에 최대 {MAX_BATCH}건까지 요청할 수 있습니다")
+
+    parts = []
+    for item in requests:
+        if not isinstance(item, dict):
+            item = {}
+        path, params = item.get('path', ''), item.get('params') or {}
+        try:
+            if not isinstance(path, str):
+                raise ApiError(400, "'path' 는 문자열이어야 합니다")
+            if not isinstance(params, dict):
+                raise ApiError(400, "'params' 는 객체여야 합니다")
+            etag, body = handle(path, {str(k): str(v) for k, v in params.items()})
+            status = 200
+        except ApiError as e:
+            etag, body, status = None, encode({'error': e.message}), e.status
+        except Exception as e:
+            # 한 건의 실패가 배치 전체 응답을 막지 않도록 해당 항목만 500
+            traceback.print_exc()
+            etag, body, status = None, encode({'error': f"서버 내부 오류: {type(e).__name__}"}), 500
+        head = encode({'path': path, 'status': status, 'etag': etag})
+        parts.append(head[:-1] + b',"body":' + body + b'}')
+    return b'{"responses":[' + b','.join(parts) + b']}'
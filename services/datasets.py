@@ -0,0 +1,208 @@
+import importlib
+import os
+import sys
+import threading
+import time
+
+from services.metrics import count_cache, timed
+from services.warmup import start_prewarm
+
+# ------------------------------------------------------------------------------
+# 전체 페이지 공용 데이터셋 레지스트리
+# ------------------------------------------------------------------------------
+# - 데이터셋마다 "어떻게 만드는지"만 선언해두고 (로더 함수 경로, 의존 데이터셋, TTL, 원본 파일)
+# - 서버 프로세스 전체에서 데이터셋당 인스턴스 하나만 만들어 모든 세션이 같이 읽음
+#   (st.cache_data 처럼 세션마다 복사본을 만들지 않으므로 동시 접속이 늘어도 메모리 일정)
+# - 공유 객체이므로 페이지에서는 절대 직접 수정하지 말 것 (열 추가는 df.assign(...) 사용)
+# - 원본 파일이 바뀌거나 TTL이 지나면, 또는 invalidate()를 부르면 다음 get()에서 다시 만듦
+#   (의존하는 데이터셋도 함께 다시 만들어짐)
+
+
+class DatasetSpec:
+    def __init__(self, name, loader, deps=(), ttl=None, path=None, description=''):
+        self.name = name
+        self.loader = loader          # 'module:function' (필요할 때만 import 해서 가벼운 페이지는 pandas 안 불러옴)
+        self.deps = tuple(deps)       # 로더에 순서대로 넘겨줄 데이터셋 이름
+        self.ttl = ttl                # 초 단위 유효 시간 (None = 무기한)
+        self.path = path              # 로컬 원본 파일 (수정 시각이 바뀌면 다시 로드)
+        self.description = description
+
+    def load(self, *dep_values):
+        module_name, attr_path = self.loader.split(':')
+        func = importlib.import_module(module_name)
+        for attr in attr_path.split('.'):
+            func = getattr(func, attr)
+        if self.path is not None and not self.deps:
+            return func(self.path)
+        return func(*dep_values)
+
+    def stamp(self):
+        return os.path.getmtime(self.path) if self.path and os.path.exists(self.path) else None
+
+
+class DatasetRegistry:
+    def __init__(self):
+        self._specs = {}
+        self._entries = {}    # name -> {'value', 'loaded_at', 'elapsed', 'stamp', 'version', 'dep_versions'}
+        self._versions = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, spec):
+        with self._lock:
+            self._specs[spec.name] = spec
+            self._locks[spec.name] = threading.RLock()
+
+    def names(self):
+        return list(self._specs)
+
+    def spec(self, name):
+        return self._specs[name]
+
+    def _is_fresh(self, spec, entry, dep_versions):
+        if entry is None:
+            return False
+        if spec.ttl is not None and time.time() - entry['loaded_at'] > spec.ttl:
+            return False
+        if entry['stamp'] != spec.stamp():
+            return False
+        return entry['dep_versions'] == dep_versions
+
+    def get(self, name):
+        """공유 인스턴스 반환 (없거나 오래됐으면 이 자리에서 한 번만 로드, 동시 요청은 기다림)"""
+        spec = self._specs[name]
+
+        # 의존 데이터셋을 먼저 최신으로 맞춤
+        dep_values = [self.get(dep) for dep in spec.deps]
+        dep_versions = tuple(self._versions.get(dep, 0) for dep in spec.deps)
+
+        entry = self._entries.get(name)
+        if self._is_fresh(spec, entry, dep_versions):
+            count_cache(f'dataset.{name}', True)
+            return entry['value']
+
+        count_cache(f'dataset.{name}', False)
+        with self._locks[name]:
+            # 기다리는 동안 다른 세션이 이미 만들었을 수 있음
+            entry = self._entries.get(name)
+            if self._is_fresh(spec, entry, dep_versions):
+                return entry['value']
+
+            stamp = spec.stamp()
+            started = time.perf_counter()
+            with timed(f'dataset.load.{name}'):
+                value = spec.load(*dep_values)
+            version = self._versions.get(name, 0) + 1
+            self._versions[name] = version
+            self._entries[name] = {
+                'value': value,
+                'loaded_at': time.time(),
+                'elapsed': time.perf_counter() - started,
+                'stamp': stamp,
+                'version': version,
+                'dep_versions': dep_versions,
+            }
+            return value
+
+    def version(self, name):
+        """최신 상태로 맞춘 뒤의 버전 번호 (다시 로드될 때마다 1씩 증가 - 결과 캐시 키로 사용)"""
+        self.get(name)
+        return self._versions.get(name, 0)
+
+    def invalidate(self, name=None):
+        """데이터셋(과 그것에 의존하는 데이터셋)을 버림. name=None 이면 전부"""
+        targets = set(self._specs) if name is None else {name}
+        changed = True
+        while changed:
+            changed = False
+            for spec in self._specs.values():
+                if spec.name not in targets and targets.intersection(spec.deps):
+                    targets.add(spec.name)
+                    changed = True
+        for target in targets:
+            with self._locks[target]:
+                self._entries.pop(target, None)
+
+    def warm_up(self, names=None):
+        """서버 시작 직후 미리 로드 (실패한 데이터셋은 건너뛰고 첫 요청 때 다시 시도)"""
+        failed = {}
+        for name in names or self.names():
+            try:
+                self.get(name)
+            except Exception as e:
+                failed[name] = e
+        return failed
+
+    def status(self):
+        rows = []
+        for name, spec in self._specs.items():
+            entry = self._entries.get(name)
+            rows.append({
+                'name': name,
+                'description': spec.description,
+                'loaded': entry is not None,
+                'age_sec': round(time.time() - entry['loaded_at'], 1) if entry else None,
+                'load_sec': round(entry['elapsed'], 3) if entry else None,
+                'version': entry['version'] if entry else 0,
+            })
+        return rows
+
+
+# ------------------------------------------------------------------------------
+# 데이터셋 선언
+# ------------------------------------------------------------------------------
+registry = DatasetRegistry()
+
+for _spec in [
+    DatasetSpec('mbti', 'services.mbti_data:load_mbti', path='pages/mbti_data.csv',
+                description='국가별 MBTI 32유형 비율 (국가명 한글화)'),
+    DatasetSpec('mbti_rollups', 'services.mbti_data:build_rollups', deps=['mbti'],
+                description='4글자 16유형 / A·T / E·I 묶음 합계'),
+    DatasetSpec('mbti_ranks', 'services.mbti_data:build_rank_table', deps=['mbti'],
+                description='국가 x 유형 세계 순위 표 (API, 리포트)'),
+    DatasetSpec('weather_daily', 'services.weather_data:load_daily', path='pages/ta_20251213130855.csv',
+                description='일별 기온 (날짜/숫자 정제)'),
+    DatasetSpec('weather_yearly_extremes', 'services.weather_data:yearly_extremes', deps=['weather_daily'],
+                description='연평균 + 절대 최저/최고 기온 (weather.py)'),
+    DatasetSpec('weather_yearly_means', 'services.weather_data:yearly_means', deps=['weather_daily'],
+                description='연평균 평균/최저/최고 기온 (전체 지점)'),
+    DatasetSpec('weather_by_station', 'services.weather_data:yearly_by_station', deps=['weather_daily'],
+                description='지점별 연평균 기온 (weather02.py, API)'),
+    DatasetSpec('weather_station_trends', 'services.weather_data:station_trends', deps=['weather_by_station'],
+                description='지점별 기온 추세 요약 (API, 리포트)'),
+    DatasetSpec('library_csv', 'services.library:fetch_library_csv', ttl=600,
+                description='서초구 전자도서관 카탈로그 CSV 원문 (10분마다 갱신)'),
+    DatasetSpec('library', 'services.library:parse_library_frame', deps=['library_csv'],
+                description='도서관 카탈로그 DataFrame (library.py)'),
+    DatasetSpec('library_facets', 'services.library:build_facet_table', deps=['library'],
+                description='자료유형 x 분야 권수 표 (API)'),
+    DatasetSpec('library_rows', 'services.library:parse_library_rows', deps=['library_csv'],
+                description='도서관 카탈로그 dict 목록 (pandas 없이)'),
+    DatasetSpec('mbti_recommender', 'services.recommend:Recommender.from_csv', path='pages/mbti_catalog.csv',
+                description='MBTI 진로/도서 추천 Alias 테이블'),
+    DatasetSpec('book_index', 'services.library:BookIndex.from_rows', deps=['library_rows'],
+                description='도서관 제목/저자 인덱스'),
+    DatasetSpec('mbti_book_join', 'services.library:join_recommendations', deps=['mbti_recommender', 'book_index'],
+                description='추천 도서 <-> 도서관 소장 정보 조인'),
+]:
+    registry.register(_spec)
+
+
+def get_dataset(name):
+    return registry.get(name)
+
+
+# ------------------------------------------------------------------------------
+# 서버 워밍업 - 진입 페이지(main2.py)에서 직접 호출, 프로세스당 한 번만 시작
+# ------------------------------------------------------------------------------
+# 무거운 라이브러리, 한글 폰트, 모든 데이터셋을 백그라운드에서 미리 준비
+# (import 만으로는 시작하지 않음 / 스트림릿 서버 밖에서 부르면 아무것도 안 함)
+def start_server_prewarm():
+    if 'streamlit' not in sys.modules:
+        return None
+    from streamlit import runtime
+    if not runtime.exists():
+        return None
+
+    from services.plotting import setup_korean_font
+    return start_prewarm(extra_steps=[setup_korean_font, registry.warm_up])
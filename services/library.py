@@ -0,0 +1,190 @@
+import csv
+import io
+import os
+import re
+import unicodedata
+import urllib.request
+
+# ------------------------------------------------------------------------------
+# 서초구 전자도서관 카탈로그 (구글 시트) 공용 로직
+# ------------------------------------------------------------------------------
+SHEET_ID = "1XC7ECtGVVanxBUX8BsLXlAcCZ2ULi2nZgFTd7BAT9zY"
+# 환경 변수로 바꿀 수 있음 (부하 테스트 등에서 로컬 대역 서버 사용)
+LIBRARY_CSV_URL = os.environ.get(
+    'LIBRARY_CSV_URL', f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv")
+
+# 컬럼 자동 인식용 키워드 (앞에 있는 키워드가 우선)
+COLUMN_KEYWORDS = {
+    'title': ['서명', '제목', 'Title'],
+    'author': ['저자', '지은이', 'Author'],
+    'publisher': ['출판', '발행', 'Publisher'],
+    'image': ['이미지', 'Image', 'URL', '표지'],
+    'status': ['대출', '상태', '이용', 'Status'],
+}
+
+
+# 자료유형(F열) / 분야(G열) 기본 위치 (library.py 사이드바 기본값과 같음)
+FACET_COLUMNS = (5, 6)
+
+
+def get_index_by_keyword(keywords, columns):
+    """키워드가 포함된 첫 번째 컬럼 위치 (없으면 0)"""
+    for i, col in enumerate(columns):
+        for k in keywords:
+            if k in col:
+                return i
+    return 0
+
+
+def find_column(keywords, columns):
+    """키워드가 포함된 첫 번째 컬럼 이름 (없으면 None)"""
+    for col in columns:
+        if any(k in col for k in keywords):
+            return col
+    return None
+
+
+def fetch_library_csv(url=LIBRARY_CSV_URL, timeout=10):
+    """카탈로그 CSV 원문 (실패 시 None) - 같은 원문에서 DataFrame / dict 목록을 모두 만듦"""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.read().decode('utf-8-sig')
+    except Exception:
+        return None
+
+
+def parse_library_rows(text):
+    """pandas 없이 카탈로그 CSV 원문을 dict 리스트로 (원문이 없으면 None)"""
+    if text is None:
+        return None
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def parse_library_frame(text):
+    """library.py 화면용 DataFrame (원문이 없으면 None)"""
+    if text is None:
+        return None
+    import pandas as pd
+    return pd.read_csv(io.StringIO(text))
+
+
+def filter_catalog(df, conditions, all_label='전체'):
+    """{컬럼: 선택값} 조건을 모두 만족하는 행 (선택값이 '전체'면 그 컬럼은 조건 없음)"""
+    mask = None
+    for col, value in conditions.items():
+        if value == all_label:
+            continue
+        cond = df[col] == value
+        mask = cond if mask is None else mask & cond
+    return df if mask is None else df[mask]
+
+
+def build_facet_table(df):
+    """자료유형 x 분야 권수 표 (카탈로그를 새로 받을 때 한 번만 계산, 카탈로그가 없으면 None)"""
+    if df is None or df.empty:
+        return None
+    cols = df.columns
+    type_col, category_col = (cols[i] if i < len(cols) else cols[0] for i in FACET_COLUMNS)
+    table = df.groupby([type_col, category_col]).size().unstack(fill_value=0)
+    return {'type_column': type_col, 'category_column': category_col, 'table': table}
+
+
+# ------------------------------------------------------------------------------
+# 제목/저자 정규화
+# ------------------------------------------------------------------------------
+_BRACKETS = re.compile(r"[\(\[\{<（【].*?[\)\]\}>）】]")
+_SUBTITLE = re.compile(r"\s*(?::|：| - | – |—)\s*.*$")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣ㄱ-ㅎㅏ-ㅣ぀-ヿ一-鿿]+")
+_AUTHOR_ROLE = re.compile(r"\s+(지음|옮김|엮음|글|그림|역|저|편|공저|외)$")
+_AUTHOR_SPLIT = re.compile(r"[,;/·&]")
+
+
+def normalize_title(title):
+    """'코스모스 : 특별판 (양장)' -> '코스모스'"""
+    text = unicodedata.normalize('NFKC', str(title)).lower()
+    text = _BRACKETS.sub(' ', text)
+    text = _SUBTITLE.sub('', text)
+    return _NON_WORD.sub('', text)
+
+
+def normalize_authors(author):
+    """'칼 세이건 지음, 홍승수 옮김' -> {'칼세이건', '홍승수'}"""
+    text = unicodedata.normalize('NFKC', str(author)).lower()
+    text = _BRACKETS.sub(' ', text)
+    names = set()
+    for part in _AUTHOR_SPLIT.split(text):
+        part = _AUTHOR_ROLE.sub('', part.strip())
+        name = _NON_WORD.sub('', part)
+        if name:
+            names.add(name)
+    return names
+
+
+def split_book_label(label):
+    """추천 도서 문자열 '코스모스 (칼 세이건)' -> ('코스모스', '칼 세이건')"""
+    m = re.match(r"^(.*?)\s*\(([^()]*)\)\s*$", label)
+    if m:
+        return m.group(1), m.group(2)
+    return label, ''
+
+
+# ------------------------------------------------------------------------------
+# 제목 인덱스 + 추천 도서 조인
+# ------------------------------------------------------------------------------
+class BookIndex:
+    """정규화된 제목 -> 카탈로그 레코드 목록 (카탈로그를 새로 받을 때 한 번만 생성)"""
+
+    @classmethod
+    def from_rows(cls, rows):
+        # 카탈로그를 받지 못했으면 인덱스도 없음
+        return cls(rows) if rows else None
+
+    def __init__(self, rows):
+        columns = list(rows[0].keys()) if rows else []
+        self.col = {name: find_column(keys, columns) for name, keys in COLUMN_KEYWORDS.items()}
+        self.by_title = {}
+
+        if self.col['title'] is None:
+            return
+        for row in rows:
+            key = normalize_title(row.get(self.col['title'], ''))
+            if key:
+                self.by_title.setdefault(key, []).append(self._record(row))
+
+    def _record(self, row):
+        def get(name):
+            col = self.col[name]
+            value = row.get(col, '') if col else ''
+            return (value or '').strip()
+
+        image = get('image')
+        return {
+            'title': get('title'),
+            'author': get('author'),
+            'publisher': get('publisher'),
+            'status': get('status') or '소장',
+            'image': image if image.startswith('http') else '',
+            'authors': normalize_authors(get('author')),
+        }
+
+    def lookup(self, title, author=''):
+        """제목이 같은 레코드 중 저자가 겹치는 것을 우선 반환"""
+        matches = self.by_title.get(normalize_title(title), [])
+        wanted = normalize_authors(author)
+        if wanted:
+            same_author = [r for r in matches if r['authors'] & wanted]
+            if same_author:
+                return same_author
+        return matches
+
+
+def join_recommendations(recommender, index):
+    """카탈로그의 모든 추천 도서를 미리 도서관 레코드와 매칭: {도서 문자열: [레코드]}"""
+    if index is None:
+        return None
+    joined = {}
+    for mbti in recommender.types():
+        for label, _ in recommender.catalog[mbti]['book']:
+            if label not in joined:
+                joined[label] = index.lookup(*split_book_label(label))
+    return joined
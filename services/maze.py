@@ -0,0 +1,251 @@
+import random
+import struct
+import zlib
+
+
+# ----------------------------------------------------
+# Kruskal Braid 미로 생성 로직 (pages/maze.py 에서 분리, 기존 로직 유지)
+# ----------------------------------------------------
+
+
+def generate_maze(grid_size, loop_prob, rng=random):
+    """Kruskal + Braid 미로 -> (2N+1)x(2N+1) 타일 맵 (1=벽, 0=통로)"""
+    # 초기화
+    parent = {}
+    rank = {}
+
+    def find(x):
+        if parent[x] != x:
+            parent[x] = find(parent[x])
+        return parent[x]
+
+    def union(a, b):
+        ra = find(a)
+        rb = find(b)
+        if ra == rb:
+            return False
+        if rank[ra] < rank[rb]:
+            parent[ra] = rb
+        else:
+            parent[rb] = ra
+            if rank[ra] == rank[rb]:
+                rank[ra] += 1
+        return True
+
+    for r in range(grid_size):
+        for c in range(grid_size):
+            parent[(r, c)] = (r, c)
+            rank[(r, c)] = 0
+
+    walls = []
+    for r in range(grid_size):
+        for c in range(grid_size):
+            if r + 1 < grid_size:
+                walls.append(((r, c), (r + 1, c)))
+            if c + 1 < grid_size:
+                walls.append(((r, c), (r, c + 1)))
+
+    rng.shuffle(walls)
+
+    vertical = [[True] * (grid_size - 1) for _ in range(grid_size)]
+    horizontal = [[True] * grid_size for _ in range(grid_size - 1)]
+
+    # Kruskal 벽 제거
+    for a, b in walls:
+        if union(a, b):
+            r1, c1 = a
+            r2, c2 = b
+            if r1 == r2:  # 세로 벽
+                vertical[r1][min(c1, c2)] = False
+            else:         # 가로 벽
+                horizontal[min(r1, r2)][c1] = False
+
+    # Dead-end 제거 (Braid)
+    def count_open(r, c):
+        cnt = 0
+        if r > 0 and not horizontal[r - 1][c]: cnt += 1
+        if r < grid_size - 1 and not horizontal[r][c]: cnt += 1
+        if c > 0 and not vertical[r][c - 1]: cnt += 1
+        if c < grid_size - 1 and not vertical[r][c]: cnt += 1
+        return cnt
+
+    for r in range(grid_size):
+        for c in range(grid_size):
+            if count_open(r, c) == 1:
+                if rng.random() < loop_prob:
+                    dirs = []
+                    if r > 0: dirs.append(("U", r - 1, c))
+                    if r < grid_size - 1: dirs.append(("D", r + 1, c))
+                    if c > 0: dirs.append(("L", r, c - 1))
+                    if c < grid_size - 1: dirs.append(("R", r, c + 1))
+
+                    if dirs:
+                        d, nr, nc = rng.choice(dirs)
+                        if d == "U": horizontal[r - 1][c] = False
+                        elif d == "D": horizontal[r][c] = False
+                        elif d == "L": vertical[r][c - 1] = False
+                        elif d == "R": vertical[r][c] = False
+
+    # 타일 맵 생성 (1=벽, 0=통로)
+    maze_map = [[1] * (grid_size * 2 + 1) for _ in range(grid_size * 2 + 1)]
+
+    for r in range(grid_size):
+        for c in range(grid_size):
+            maze_map[r*2+1][c*2+1] = 0
+
+    for r in range(grid_size):
+        for c in range(grid_size - 1):
+            if not vertical[r][c]:
+                maze_map[r*2+1][c*2+2] = 0
+
+    for r in range(grid_size - 1):
+        for c in range(grid_size):
+            if not horizontal[r][c]:
+                maze_map[r*2+2][c*2+1] = 0
+    
+    return maze_map
+
+
+# ----------------------------------------------------
+# Eller 알고리즘 스트리밍 미로 (인쇄용 / 대량 생성용 아주 큰 미로)
+# ----------------------------------------------------
+# generate_maze 는 격자 전체 + (2N+1)^2 타일 맵을 메모리에 올리지만
+# eller_rows 는 한 줄씩 만들어서 바로 내보내므로 메모리가 너비에만 비례함 (높이는 무제한)
+# Braid(막다른 길 제거)도 generate_maze 와 같은 순서(위->아래, 왼쪽->오른쪽)로 칸마다 한 번씩 적용
+_INVERT = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+
+def eller_rows(width, height, loop_prob, rng=random):
+    """Eller + Braid 미로를 위에서부터 한 줄씩 -> 타일 행 2*height+1 개 (bytearray, 길이 2*width+1, 1=벽, 0=통로)"""
+    tile_width = 2 * width + 1
+    border = bytearray(b'\x01') * tile_width
+    yield border
+
+    prev = [0] * width            # 윗줄 칸들의 집합 번호 (0..width-1 로 압축)
+    up = bytearray(width)         # 윗줄 -> 이 칸으로 통로가 있으면 1
+
+    for r in range(height):
+        last = r == height - 1
+        # 집합 번호: 0..width-1 = 윗줄에서 이어진 집합, width+c = 새 집합
+        parent = list(range(2 * width))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        labels = [prev[c] if up[c] else width + c for c in range(width)]
+
+        # 1) 가로: 다른 집합이면 무작위로 합침 (마지막 줄은 남은 집합을 모두 합침)
+        right = bytearray(max(width - 1, 0))
+        for c in range(width - 1):
+            a, b = find(labels[c]), find(labels[c + 1])
+            if a != b and (last or rng.random() < 0.5):
+                right[c] = 1
+                parent[b] = a
+
+        # 2) 세로: 집합마다 아래로 내려가는 통로를 최소 하나 (마지막 줄은 없음)
+        down = bytearray(width)
+        if not last:
+            members = {}
+            for c in range(width):
+                members.setdefault(find(labels[c]), []).append(c)
+            for cells in members.values():
+                chosen = [c for c in cells if rng.random() < 0.5] or [rng.choice(cells)]
+                for c in chosen:
+                    down[c] = 1
+
+        # 3) Dead-end 제거 (Braid): 이 줄 칸들의 벽이 모두 정해진 뒤 적용
+        for c in range(width):
+            cnt = up[c] + down[c] + (c > 0 and right[c - 1]) + (c < width - 1 and right[c])
+            if cnt == 1 and rng.random() < loop_prob:
+                dirs = []
+                if r > 0: dirs.append("U")
+                if not last: dirs.append("D")
+                if c > 0: dirs.append("L")
+                if c < width - 1: dirs.append("R")
+
+                if dirs:
+                    d = rng.choice(dirs)
+                    if d == "U":
+                        up[c] = 1
+                        parent[find(labels[c])] = find(prev[c])
+                    elif d == "D":
+                        down[c] = 1
+                    elif d == "L":
+                        right[c - 1] = 1
+                        parent[find(labels[c])] = find(labels[c - 1])
+                    elif d == "R":
+                        right[c] = 1
+                        parent[find(labels[c + 1])] = find(labels[c])
+
+        # 4) 윗줄과의 벽 행 + 이 줄의 칸 행 내보내기 (윗줄 벽은 Braid 'U' 때문에 여기서 확정)
+        if r > 0:
+            wall_row = bytearray(border)
+            wall_row[1::2] = up.translate(_INVERT)
+            yield wall_row
+        cell_row = bytearray(border)
+        cell_row[1::2] = bytes(width)
+        cell_row[2:-1:2] = right.translate(_INVERT)
+        yield cell_row
+
+        # 5) 다음 줄 준비: 집합 번호를 0..width-1 로 다시 매김
+        renumber = {}
+        prev = [renumber.setdefault(find(labels[c]), len(renumber)) for c in range(width)]
+        up = down
+
+    yield bytearray(border)
+
+
+# ----------------------------------------------------
+# 비트 단위로 압축해서 파일/이미지 스트림에 바로 쓰기 (PBM, PNG)
+# ----------------------------------------------------
+_PBM_BITS = bytes.maketrans(b'\x00\x01', b'01')   # PBM: 1 = 검정(벽)
+_PNG_BITS = bytes.maketrans(b'\x00\x01', b'10')   # 1비트 흑백 PNG: 1 = 흰색(통로)
+
+
+def pack_row(row, table=_PBM_BITS):
+    """타일 행 -> 8칸씩 1바이트 (남는 비트는 0으로 채움)"""
+    pad = -len(row) % 8
+    return int(row.translate(table) + b'0' * pad, 2).to_bytes((len(row) + pad) // 8, 'big')
+
+
+def _png_chunk(out, kind, data):
+    out.write(struct.pack('>I', len(data)) + kind + data)
+    out.write(struct.pack('>I', zlib.crc32(kind + data)))
+
+
+def write_maze(out, width, height, loop_prob=0.4, seed=None, fmt='pbm'):
+    """스트리밍 미로를 out(바이너리 파일 객체)에 PBM(P4) 또는 1비트 PNG로 기록 -> 쓴 타일 행 수"""
+    rng = random.Random(seed)
+    tile_width, tile_height = 2 * width + 1, 2 * height + 1
+    rows = eller_rows(width, height, loop_prob, rng)
+    count = 0
+
+    if fmt == 'pbm':
+        out.write(b'P4\n%d %d\n' % (tile_width, tile_height))
+        for row in rows:
+            out.write(pack_row(row))
+            count += 1
+
+    elif fmt == 'png':
+        out.write(b'\x89PNG\r\n\x1a\n')
+        _png_chunk(out, b'IHDR', struct.pack('>IIBBBBB', tile_width, tile_height, 1, 0, 0, 0, 0))
+        compressor = zlib.compressobj(6)
+        pending, size = [], 0
+        for row in rows:
+            data = compressor.compress(b'\x00' + pack_row(row, _PNG_BITS))  # 필터 0 (없음)
+            pending.append(data)
+            size += len(data)
+            count += 1
+            if size >= 1 << 16:  # IDAT 청크는 64KB 정도씩
+                _png_chunk(out, b'IDAT', b''.join(pending))
+                pending, size = [], 0
+        pending.append(compressor.flush())
+        _png_chunk(out, b'IDAT', b''.join(pending))
+        _png_chunk(out, b'IEND', b'')
+
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (pbm, png)")
+    return count
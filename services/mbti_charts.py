@@ -0,0 +1,64 @@
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+from services.metrics import instrument
+
+# -----------------------------------------------------------------------------
+# mbti02.py 그래프 - 화면(pages/mbti02.py)과 일괄 리포트(tools/batch_reports.py)가 같은 함수로 그림
+# -----------------------------------------------------------------------------
+# 모두 전달받은 ax 에만 그림 (plt 현재 축에 의존하지 않음 -> 한 Figure 에 여러 개를 배치 가능)
+PIE_TOP_N = 8
+
+
+# -----------------------------------------------------------------------------
+# 원그래프 (Top 8 + 기타)
+# -----------------------------------------------------------------------------
+@instrument('mbti02.pie')
+def plot_pie_chart(data_series, title, ax):
+    data_sorted = data_series.sort_values(ascending=False)
+
+    # 상위 8개 추출
+    if len(data_sorted) > PIE_TOP_N:
+        top_slice = data_sorted[:PIE_TOP_N]
+        others_value = data_sorted[PIE_TOP_N:].sum()
+        # Series 이름 변경 (한글화)
+        top_slice['기타(Others)'] = others_value
+    else:
+        top_slice = data_sorted
+
+    wedges, texts, autotexts = ax.pie(
+        top_slice,
+        labels=top_slice.index,
+        autopct='%1.1f%%',
+        startangle=90,
+        colors=sns.color_palette("pastel"),
+        wedgeprops={'edgecolor': 'white'}
+    )
+
+    ax.set_title(title, pad=20, fontsize=14, fontweight='bold')
+    plt.setp(texts, size=10)
+    plt.setp(autotexts, size=10, weight="bold")
+
+
+# -----------------------------------------------------------------------------
+# 막대그래프
+# -----------------------------------------------------------------------------
+def plot_type_bar(data_series, title, ax, palette, ylabel="비율"):
+    """유형별 비율 막대그래프 (전체 평균 / 국가별 분포 / 묶음 비교)"""
+    sns.barplot(x=data_series.index, y=data_series.values, palette=palette, ax=ax)
+
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.set_xlabel("MBTI 유형", fontsize=12)
+    ax.set_title(title, fontsize=15)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right', fontsize=9)
+
+
+def plot_rank_bar(top, mbti_type, ax, focus='대한민국'):
+    """유형 비율 상위 국가 막대그래프 (기준 국가는 빨간색)"""
+    colors = ['crimson' if country == focus else 'steelblue' for country in top['Country']]
+    sns.barplot(x='Country', y=mbti_type, data=top, palette=colors, ax=ax)
+
+    ax.set_title(f"{mbti_type} 유형 비율 상위 {len(top)}개국", fontsize=15)
+    ax.set_ylabel("비율", fontsize=12)
+    ax.set_xlabel("국가", fontsize=12)
+    plt.setp(ax.get_xticklabels(), rotation=45, fontsize=10)
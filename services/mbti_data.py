@@ -0,0 +1,104 @@
+import pandas as pd
+
+
+# -----------------------------------------------------------------------------
+# 세계 MBTI 데이터 (pages/mbti_data.csv) 로드 및 파생 계산
+# -----------------------------------------------------------------------------
+MBTI_CSV_PATH = 'pages/mbti_data.csv'
+
+# 국가명 한글 매핑 (없는 국가는 영어 그대로 출력됩니다)
+COUNTRY_MAP = {
+    'South Korea': '대한민국', 'Korea, South': '대한민국',
+    'United States': '미국', 'Japan': '일본', 'China': '중국',
+    'Russia': '러시아', 'Germany': '독일', 'France': '프랑스',
+    'United Kingdom': '영국', 'Italy': '이탈리아', 'Canada': '캐나다',
+    'Australia': '호주', 'Brazil': '브라질', 'India': '인도',
+    'Spain': '스페인', 'Mexico': '멕시코', 'Indonesia': '인도네시아',
+    'Turkey': '터키', 'Netherlands': '네덜란드', 'Switzerland': '스위스',
+    'Sweden': '스웨덴', 'Poland': '폴란드', 'Belgium': '벨기에',
+    'Thailand': '태국', 'Vietnam': '베트남', 'Philippines': '필리핀',
+    'Malaysia': '말레이시아', 'Singapore': '싱가포르', 'Taiwan': '대만',
+    'Afghanistan': '아프가니스탄', 'Ukraine': '우크라이나', 'Egypt': '이집트',
+    'Iran': '이란', 'Iraq': '이라크', 'Saudi Arabia': '사우디아라비아',
+    'Argentina': '아르헨티나', 'Chile': '칠레', 'Colombia': '콜롬비아',
+    'Peru': '페루', 'South Africa': '남아공', 'Nigeria': '나이지리아',
+    'Kenya': '케냐', 'New Zealand': '뉴질랜드', 'Greece': '그리스',
+    'Portugal': '포르투갈', 'Austria': '오스트리아', 'Norway': '노르웨이',
+    'Finland': '핀란드', 'Denmark': '덴마크', 'Ireland': '아일랜드',
+    'Czech Republic': '체코', 'Hungary': '헝가리', 'Romania': '루마니아'
+}
+
+
+def load_mbti(path=MBTI_CSV_PATH):
+    df = pd.read_csv(path)
+    # 국가명 한글 변환 적용
+    df['Country'] = df['Country'].map(COUNTRY_MAP).fillna(df['Country'])
+    return df
+
+
+# -----------------------------------------------------------------------------
+# 유형 묶음(롤업) 계산: 32개 XXXX-A/T 컬럼 -> 4글자 16개 / A·T / E·I
+# -----------------------------------------------------------------------------
+# 묶음 이름 -> (컬럼명에서 그룹 키를 뽑는 함수, 화면 표시 이름)
+ROLLUP_GROUPS = {
+    'type16': (lambda col: col.split('-')[0], '4글자 유형 (16개)'),
+    'identity': (lambda col: col.split('-')[1], 'A(자기주장형) vs T(신중형)'),
+    'energy': (lambda col: col[0], 'E(외향) vs I(내향)'),
+}
+
+
+def build_projection(columns):
+    """32개 컬럼 -> 모든 묶음 그룹으로 가는 0/1 투영 행렬 (행: 원본 컬럼, 열: (묶음, 그룹))"""
+    keys = []
+    for name, (key_func, _) in ROLLUP_GROUPS.items():
+        keys += [(name, g) for g in sorted({key_func(c) for c in columns})]
+
+    projection = pd.DataFrame(0.0, index=columns, columns=pd.MultiIndex.from_tuples(keys))
+    for name, (key_func, _) in ROLLUP_GROUPS.items():
+        for col in columns:
+            projection.loc[col, (name, key_func(col))] = 1.0
+    return projection
+
+
+def build_rollups(df):
+    """로드 시 한 번만 계산: 행렬곱 한 번으로 모든 묶음 합계를 구한 뒤 묶음별로 나눔"""
+    mbti_cols = df.columns[1:]
+    projection = build_projection(mbti_cols)
+
+    rolled = pd.DataFrame(
+        df[mbti_cols].to_numpy() @ projection.to_numpy(),
+        index=df['Country'].values,
+        columns=projection.columns
+    )
+    return {name: rolled[name] for name in ROLLUP_GROUPS}
+
+
+# -----------------------------------------------------------------------------
+# 화면/리포트 공용 계산
+# -----------------------------------------------------------------------------
+def country_distribution(df, country):
+    """특정 국가의 32유형 비율 (큰 순서)"""
+    mbti_cols = df.columns[1:]
+    country_data = df[df['Country'] == country][mbti_cols].T
+    country_data.columns = ['Ratio']
+    return country_data['Ratio'].sort_values(ascending=False)
+
+
+def rank_countries(df, mbti_type, focus='대한민국', top_n=10):
+    """유형 비율 상위 top_n 국가 + 기준 국가(focus)의 (비율, 세계 순위) - 기준 국가가 없으면 None"""
+    top = df[['Country', mbti_type]].sort_values(by=mbti_type, ascending=False).head(top_n)
+
+    focus_row = df[df['Country'] == focus]
+    if focus_row.empty:
+        return top, None
+    value = focus_row[mbti_type].values[0]
+    rank = df[mbti_type].rank(ascending=False).loc[focus_row.index[0]]
+    return top, (value, int(rank))
+
+
+def build_rank_table(df):
+    """국가 x 유형 세계 순위 표 (1 = 비율이 가장 높음, rank_countries 와 같은 기준)"""
+    mbti_cols = df.columns[1:]
+    ranks = df[mbti_cols].rank(ascending=False)
+    ranks.index = df['Country'].values
+    return ranks
@@ -0,0 +1,177 @@
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# ------------------------------------------------------------------------------
+# 페이지 실행 구간(hot path) 계측 + 캐시 적중률 (프로세스 내부 메트릭 저장소)
+# ------------------------------------------------------------------------------
+#   with timed('weather.polyfit'):
+#       slope, intercept = np.polyfit(x, y, 1)
+#
+#   @instrument('maze.generate')
+#   def generate_maze(...): ...
+#
+# 환경 변수 APP_METRICS=1 일 때만 켜짐. 꺼져 있으면 timed()는 아무것도 안 하는
+# 공용 컨텍스트를 그대로 돌려주고, instrument()는 플래그 한 번만 확인하고 원래 함수를 호출함
+ENABLED = os.environ.get('APP_METRICS', '') not in ('', '0', 'false')
+SAMPLE_SIZE = 512  # 구간별로 최근 측정값만 보관 (백분위 계산용)
+
+_NOOP = contextlib.nullcontext()
+
+
+class MetricsStore:
+    def __init__(self, sample_size=SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}   # name -> {'count', 'total', 'max', 'samples'}
+            self.caches = {}   # name -> {'hit', 'miss'}
+
+    def observe(self, name, seconds):
+        with self._lock:
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = {'count': 0, 'total': 0.0, 'max': 0.0,
+                                             'samples': deque(maxlen=self.sample_size)}
+            stage['count'] += 1
+            stage['total'] += seconds
+            stage['max'] = max(stage['max'], seconds)
+            stage['samples'].append(seconds)
+
+    def count_cache(self, name, hit):
+        with self._lock:
+            cache = self.caches.setdefault(name, {'hit': 0, 'miss': 0})
+            cache['hit' if hit else 'miss'] += 1
+
+    def snapshot(self):
+        """JSON으로 바로 내보낼 수 있는 요약 (초 단위)"""
+        with self._lock:
+            stages = {name: (dict(s), sorted(s['samples'])) for name, s in self.stages.items()}
+            caches = {name: dict(c) for name, c in self.caches.items()}
+
+        def pct(samples, q):
+            return samples[min(len(samples) - 1, int(q * len(samples)))] if samples else 0.0
+
+        return {
+            'stages': {
+                name: {
+                    'count': s['count'],
+                    'total': s['total'],
+                    'mean': s['total'] / s['count'],
+                    'p50': pct(samples, 0.50),
+                    'p95': pct(samples, 0.95),
+                    'max': s['max'],
+                } for name, (s, samples) in sorted(stages.items())
+            },
+            'caches': dict(sorted(caches.items())),
+        }
+
+
+store = MetricsStore()
+
+
+def set_enabled(value):
+    global ENABLED
+    ENABLED = bool(value)
+
+
+@contextlib.contextmanager
+def _timer(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        store.observe(name, time.perf_counter() - started)
+
+
+def timed(name):
+    """구간 시간 측정 컨텍스트 (꺼져 있으면 no-op)"""
+    return _timer(name) if ENABLED else _NOOP
+
+
+def instrument(name):
+    """함수 전체 시간을 측정하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            with _timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count_cache(name, hit):
+    if ENABLED:
+        store.count_cache(name, hit)
+
+
+# ------------------------------------------------------------------------------
+# 내보내기 (Prometheus 텍스트 / JSON)
+# ------------------------------------------------------------------------------
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def to_prometheus(snapshot=None):
+    snap = snapshot or store.snapshot()
+    lines = [
+        '# HELP app_stage_seconds Time spent in instrumented page stages.',
+        '# TYPE app_stage_seconds summary',
+    ]
+    for name, s in snap['stages'].items():
+        label = f'stage="{_label(name)}"'
+        lines.append(f'app_stage_seconds{{{label},quantile="0.5"}} {s["p50"]:.6f}')
+        lines.append(f'app_stage_seconds{{{label},quantile="0.95"}} {s["p95"]:.6f}')
+        lines.append(f'app_stage_seconds_sum{{{label}}} {s["total"]:.6f}')
+        lines.append(f'app_stage_seconds_count{{{label}}} {s["count"]}')
+
+    lines += [
+        '# HELP app_cache_requests_total Cache lookups by result.',
+        '# TYPE app_cache_requests_total counter',
+    ]
+    for name, c in snap['caches'].items():
+        for result in ('hit', 'miss'):
+            lines.append(f'app_cache_requests_total{{cache="{_label(name)}",result="{result}"}} {c[result]}')
+    return '\n'.join(lines) + '\n'
+
+
+def to_json(snapshot=None):
+    return json.dumps(snapshot or store.snapshot(), ensure_ascii=False, indent=2)
+
+
+# ------------------------------------------------------------------------------
+# 디버그 사이드바 (APP_METRICS=1 일 때만 표시)
+# ------------------------------------------------------------------------------
+def show_debug_sidebar(prefix=None):
+    """현재 페이지(prefix로 시작하는 구간) 위주로 측정값과 캐시 적중률을 사이드바에 표시"""
+    if not ENABLED:
+        return
+    import streamlit as st
+
+    snap = store.snapshot()
+    with st.sidebar.expander("⏱️ 성능 측정 (debug)", expanded=False):
+        rows = [{'구간': name, '횟수': s['count'], '평균(ms)': round(s['mean'] * 1000, 2),
+                 'p95(ms)': round(s['p95'] * 1000, 2), '최대(ms)': round(s['max'] * 1000, 2)}
+                for name, s in snap['stages'].items()
+                if prefix is None or name.startswith(prefix) or name.startswith('dataset.')]
+        st.dataframe(rows, hide_index=True)
+
+        if snap['caches']:
+            st.caption("캐시 적중")
+            st.dataframe([{'캐시': name, 'hit': c['hit'], 'miss': c['miss']}
+                          for name, c in snap['caches'].items()], hide_index=True)
+
+        c1, c2 = st.columns(2)
+        c1.download_button("Prometheus", to_prometheus(snap), file_name="metrics.prom")
+        c2.download_button("JSON", to_json(snap), file_name="metrics.json")
+        if st.button("초기화", key="metrics_reset"):
+            store.reset()
@@ -0,0 +1,73 @@
+import os
+import threading
+import urllib.request
+import warnings
+
+# ------------------------------------------------------------------------------
+# Matplotlib 한글 폰트 설정 (스트림릿 클라우드 대응) - 프로세스당 한 번만 실행
+# ------------------------------------------------------------------------------
+FONT_URL = os.environ.get(
+    'KOREAN_FONT_URL', "https://github.com/google/fonts/raw/main/ofl/nanumgothic/NanumGothic-Regular.ttf")
+FONT_FILE = os.environ.get('KOREAN_FONT_FILE', "NanumGothic.ttf")
+FONT_FAMILY = 'nanumgothic'  # 공백/대소문자 무시하고 비교 (배포판에 따라 'Nanum Gothic')
+
+_lock = threading.Lock()
+_ready = False
+
+
+def font_family(path):
+    """폰트 파일에 적힌 글꼴 이름 (읽을 수 없으면 None)"""
+    from matplotlib.ft2font import FT2Font
+    try:
+        return FT2Font(path).family_name
+    except (OSError, RuntimeError, ValueError):
+        return None
+
+
+def is_korean_font(path):
+    family = font_family(path)
+    return family is not None and family.replace(' ', '').lower() == FONT_FAMILY
+
+
+def ensure_font_file():
+    """나눔고딕 폰트 파일 다운로드 (없거나 다른 글꼴일 경우) - 여러 프로세스가 동시에 받지 않도록 부모 프로세스에서 먼저 호출"""
+    if os.path.exists(FONT_FILE) and is_korean_font(FONT_FILE):
+        return
+
+    # 받는 도중에 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 받은 뒤 교체
+    tmp = f'{FONT_FILE}.{os.getpid()}.tmp'
+    try:
+        urllib.request.urlretrieve(FONT_URL, tmp)
+    except OSError:
+        if not os.path.exists(FONT_FILE):
+            raise
+        warnings.warn(f"{FONT_FILE} 이 나눔고딕이 아닌데({font_family(FONT_FILE)}) 다시 받지 못함 - 한글이 깨질 수 있음")
+        return
+    os.replace(tmp, FONT_FILE)
+    if not is_korean_font(FONT_FILE):
+        warnings.warn(f"{FONT_URL} 에서 받은 폰트가 나눔고딕이 아님({font_family(FONT_FILE)}) - 한글이 깨질 수 있음")
+
+
+def setup_korean_font():
+    """나눔고딕 등록 + 기본 스타일 적용 (두 번째 호출부터는 바로 반환)"""
+    global _ready
+    with _lock:
+        if _ready:
+            return
+
+        # matplotlib 는 실제로 그래프가 필요한 시점에만 불러옴
+        import matplotlib.font_manager as fm
+        import matplotlib.pyplot as plt
+
+        ensure_font_file()
+
+        # 폰트 등록
+        font_entry = fm.FontEntry(fname=FONT_FILE, name='NanumGothic')
+        fm.fontManager.ttflist.append(font_entry)
+
+        # 그래프 기본 설정 (스타일을 먼저 적용해야 폰트 설정이 덮어써지지 않음)
+        plt.style.use('seaborn-v0_8-whitegrid')
+        plt.rcParams['font.family'] = 'NanumGothic'
+        plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
+
+        _ready = True
@@ -0,0 +1,249 @@
+import asyncio
+import concurrent.futures
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urljoin
+
+import httpx
+
+from services.metrics import count_cache
+from services.query import encode_query
+
+# ------------------------------------------------------------------------------
+# 쇼핑몰별 어댑터: 검색 URL 만들기 + 결과 페이지에서 상품/가격 뽑기
+# ------------------------------------------------------------------------------
+# 결과 페이지 파싱은 schema.org JSON-LD(Product / ItemList)를 기본으로 사용
+# 사이트 구조가 다르면 어댑터에서 parse()만 다시 정의하면 됨
+_JSON_LD = re.compile(r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.S | re.I)
+
+
+def parse_price(value):
+    """'12,340원' / 12340.0 -> 12340 (숫자가 없으면 None)"""
+    digits = re.sub(r"[^0-9.]", "", str(value))
+    if not digits:
+        return None
+    try:
+        return int(float(digits))
+    except ValueError:
+        return None
+
+
+def _iter_products(node):
+    if isinstance(node, list):
+        for child in node:
+            yield from _iter_products(child)
+    elif isinstance(node, dict):
+        if node.get('@type') == 'Product':
+            yield node
+        for key in ('@graph', 'itemListElement', 'item'):
+            if key in node:
+                yield from _iter_products(node[key])
+
+
+class ShopAdapter:
+    name = ''
+    label = ''
+    base_url = ''
+    search_path = ''
+    timeout = 5.0
+
+    def __init__(self, base_url=None, timeout=None):
+        # 테스트/로컬 대역 서버를 쓸 때는 base_url만 바꿔서 주입
+        if base_url is not None:
+            self.base_url = base_url.rstrip('/')
+        if timeout is not None:
+            self.timeout = timeout
+
+    def search_url(self, query):
+        return self.base_url + self.search_path.format(q=encode_query(query))
+
+    def parse(self, html):
+        items = []
+        for block in _JSON_LD.findall(html):
+            try:
+                data = json.loads(block)
+            except ValueError:
+                continue
+            for product in _iter_products(data):
+                offers = product.get('offers') or {}
+                if isinstance(offers, list):
+                    offers = offers[0] if offers else {}
+                price = parse_price(offers.get('price') or offers.get('lowPrice') or '')
+                if price is None:
+                    continue
+                items.append({
+                    'title': str(product.get('name', '')).strip(),
+                    'price': price,
+                    'url': offers.get('url') or product.get('url') or '',
+                })
+        return items
+
+
+class CoupangAdapter(ShopAdapter):
+    name, label = 'coupang', '🚀 쿠팡'
+    base_url = 'https://www.coupang.com'
+    search_path = '/np/search?component=&q={q}&channel=user&sorter=salePriceAsc'
+
+
+class GmarketAdapter(ShopAdapter):
+    name, label = 'gmarket', '🟢 G마켓'
+    base_url = 'https://browse.gmarket.co.kr'
+    search_path = '/search?keyword={q}&s=1'
+
+
+class St11Adapter(ShopAdapter):
+    name, label = 'st11', '🔴 11번가'
+    base_url = 'https://search.11st.co.kr'
+    search_path = '/Search.tmall?kwd={q}&sortCd=L'
+
+
+class LotteAdapter(ShopAdapter):
+    name, label = 'lotte', '🛍️ 롯데홈쇼핑'
+    base_url = 'https://www.lotteimall.com'
+    search_path = '/search/searchMain.lotte?headerQuery={q}&s_rank=3'
+
+
+class AuctionAdapter(ShopAdapter):
+    name, label = 'auction', '🟡 옥션'
+    base_url = 'http://browse.auction.co.kr'
+    search_path = '/search?keyword={q}&s=8'
+
+
+ADAPTER_CLASSES = [CoupangAdapter, GmarketAdapter, St11Adapter, LotteAdapter, AuctionAdapter]
+
+
+def default_adapters(base_urls=None):
+    """base_urls: {어댑터 이름: 대체 base_url} (로컬 대역 서버용)
+
+    환경 변수 PRICE_SEARCH_BASE_URL 이 있으면 모든 쇼핑몰을 '<그 주소>/<어댑터 이름>' 으로 보냄
+    """
+    base_urls = base_urls or {}
+    standin = os.environ.get('PRICE_SEARCH_BASE_URL')
+    if standin and not base_urls:
+        base_urls = {cls.name: f"{standin.rstrip('/')}/{cls.name}" for cls in ADAPTER_CLASSES}
+    return [cls(base_url=base_urls.get(cls.name)) for cls in ADAPTER_CLASSES]
+
+
+# ------------------------------------------------------------------------------
+# 짧은 TTL 캐시 (검색어 -> 결과)
+# ------------------------------------------------------------------------------
+class TTLCache:
+    def __init__(self, ttl=300, maxsize=512):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires, value = hit
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                # 가장 먼저 만료되는 항목부터 정리
+                oldest = min(self._data, key=lambda k: self._data[k][0])
+                del self._data[oldest]
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# ------------------------------------------------------------------------------
+# 동시 검색기: 전용 이벤트 루프 스레드 + 재사용되는 httpx 커넥션 풀
+# ------------------------------------------------------------------------------
+class PriceAggregator:
+    def __init__(self, adapters=None, cache_ttl=300, failure_ttl=15, max_connections=20):
+        self.adapters = adapters if adapters is not None else default_adapters()
+        self.cache = TTLCache(ttl=cache_ttl)
+        self.failure_ttl = failure_ttl  # 모든 쇼핑몰이 실패한 결과는 짧게만 캐시
+        self._limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._client = None
+
+        # Streamlit 스크립트 스레드와 분리된 이벤트 루프 (세션끼리 커넥션 풀 공유)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='price-search', daemon=True)
+        self._thread.start()
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=self._limits,
+                follow_redirects=True,
+                headers={'User-Agent': 'Mozilla/5.0 (price-search)'},
+            )
+        return self._client
+
+    async def _fetch_one(self, adapter, query):
+        started = time.perf_counter()
+        result = {'shop': adapter.label, 'status': 'ok', 'items': [], 'url': adapter.search_url(query)}
+        try:
+            resp = await asyncio.wait_for(self._get_client().get(result['url']), timeout=adapter.timeout)
+            resp.raise_for_status()
+            result['items'] = adapter.parse(resp.text)
+            for item in result['items']:
+                item['url'] = urljoin(str(resp.url), item['url']) if item['url'] else result['url']
+        except asyncio.TimeoutError:
+            result['status'] = 'timeout'
+        except Exception as e:
+            result['status'] = f'error: {type(e).__name__}'
+        result['elapsed'] = time.perf_counter() - started
+        return result
+
+    async def _fetch_all(self, query):
+        return await asyncio.gather(*(self._fetch_one(a, query) for a in self.adapters))
+
+    def search(self, query, key=None):
+        """5개 쇼핑몰을 동시에 조회 -> (가격순 병합 목록, 쇼핑몰별 상태)
+
+        query 는 쇼핑몰에 그대로 보낼 검색어, key 는 캐시 키 (없으면 query)
+        key 에 normalize_query() 결과를 넘기면 표기만 다른 검색어끼리 캐시를 공유함
+        """
+        if key is None:
+            key = query
+        cached = self.cache.get(key)
+        count_cache('price_search', cached is not None)
+        if cached is not None:
+            return cached
+
+        future = asyncio.run_coroutine_threadsafe(self._fetch_all(query), self._loop)
+        wait = max(a.timeout for a in self.adapters) + 1
+        try:
+            shop_results = future.result(timeout=wait)
+        except concurrent.futures.TimeoutError:
+            # 이벤트 루프가 밀려서 쇼핑몰별 타임아웃보다 늦어진 경우 -> 전부 timeout 으로 처리
+            future.cancel()
+            shop_results = [{'shop': a.label, 'status': 'timeout', 'items': [], 'url': a.search_url(query),
+                             'elapsed': wait} for a in self.adapters]
+
+        merged = []
+        for res in shop_results:
+            for item in res['items']:
+                merged.append({'shop': res['shop'], **item})
+        merged.sort(key=lambda item: item['price'])
+
+        status = [{k: v for k, v in res.items() if k != 'items'} | {'count': len(res['items'])}
+                  for res in shop_results]
+        value = (merged, status)
+        # 한 곳이라도 응답했으면 (상품이 0개여도) 그대로 캐시, 모두 실패했으면 짧게만 캐시
+        # -> 재실행/추천 버튼마다 5개 쇼핑몰을 다시 기다리지 않음
+        responded = any(res['status'] == 'ok' for res in shop_results)
+        self.cache.set(key, value, ttl=None if responded else self.failure_ttl)
+        return value
+
+    def close(self):
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
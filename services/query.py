@@ -0,0 +1,131 @@
+import os
+import re
+import threading
+import unicodedata
+from urllib.parse import quote_plus
+
+# ------------------------------------------------------------------------------
+# 검색어 정규화: 띄어쓰기 / 수량·단위 표기 통일
+# ------------------------------------------------------------------------------
+# 단위 표기 -> 대표 표기 (긴 표기부터 매칭되도록 정렬해서 사용)
+UNIT_ALIASES = {
+    '개입': ['개입', '입'],
+    '개': ['개', 'ea', 'pcs'],
+    '팩': ['팩', 'pack', 'pk'],
+    '봉': ['봉지', '봉'],
+    '박스': ['박스', 'box'],
+    'ml': ['ml', '밀리리터'],
+    'l': ['l', 'ℓ', '리터'],
+    'g': ['g', '그램'],
+    'kg': ['kg', '킬로그램', '키로'],
+    '인치': ['인치', 'inch', '"'],
+    'gb': ['gb', '기가'],
+    'tb': ['tb', '테라'],
+}
+_ALIAS_TO_UNIT = {alias: unit for unit, aliases in UNIT_ALIASES.items() for alias in aliases}
+_UNIT_PATTERN = '|'.join(re.escape(a) for a in sorted(_ALIAS_TO_UNIT, key=len, reverse=True))
+
+# 숫자 + (공백) + 단위, 뒤에 영문/숫자가 바로 붙으면 단위가 아님 (예: '5gram' X)
+_QUANTITY = re.compile(rf"(\d+(?:\.\d+)?)\s*({_UNIT_PATTERN})(?![a-z0-9])")
+# 수량 / 한글 단어 / 그 밖의 글자 덩어리(영문·숫자·기호·다른 언어, 모델명 's24', '1+1', 'c++' 등)
+# 한글과 한글이 아닌 글자 사이에서 끊어서 띄어쓰기를 통일함 ('신라면20' -> '신라면 20')
+_TOKEN = re.compile(rf"\d+(?:\.\d+)?(?:{_UNIT_PATTERN})(?![a-z0-9])|[가-힣]+|[^\s가-힣]+")
+# 덩어리 안에서 남길 글자: 모든 언어의 글자/숫자 + 의미 있는 기호 (나머지 괄호·따옴표 등은 버림)
+_JUNK = re.compile(r"[^\w+%#&.\-/]|_")
+_EDGE = '.-/'  # 덩어리 양 끝에서는 의미 없는 기호
+
+
+def clean_query(text):
+    """사용자 입력 그대로의 검색어에서 앞뒤/중복 공백만 정리 (쇼핑몰 URL 용)"""
+    return re.sub(r"\s+", " ", str(text)).strip()
+
+
+def normalize_query(text):
+    """'신라면20 개입' / ' 신라면  20개입 ' -> '신라면 20개입' (캐시 키 / 검색 기록 / 자동완성 용)
+
+    띄어쓰기와 수량·단위 표기만 통일하고 글자와 '+', '%' 같은 기호는 남김 ('신라면 1+1', 'c++ 책', 'スイッチ')
+    """
+    text = unicodedata.normalize('NFKC', str(text)).lower().strip()
+    text = re.sub(r"\s+", " ", text)
+
+    # 수량 표기 통일: '20 개입' -> '20개입', '1.5L' -> '1.5l'
+    text = _QUANTITY.sub(lambda m: m.group(1) + _ALIAS_TO_UNIT[m.group(2)], text)
+
+    # 한글/그 밖의 글자/수량 덩어리 사이를 공백 하나로 통일 (괄호·따옴표 같은 기호만 남은 덩어리는 버림)
+    tokens = (part.strip(_EDGE) for t in _TOKEN.findall(text) for part in _JUNK.sub(' ', t).split())
+    return ' '.join(t for t in tokens if t)
+
+
+def encode_query(text):
+    """URL 쿼리스트링용 퍼센트 인코딩 (한글은 UTF-8, 공백은 +)"""
+    return quote_plus(text, encoding='utf-8')
+
+
+# ------------------------------------------------------------------------------
+# 자동완성용 접두사 트라이 (노드마다 인기 검색어 top-k를 미리 보관)
+# ------------------------------------------------------------------------------
+class QueryTrie:
+    def __init__(self, top_k=10):
+        self.top_k = top_k
+        self.root = {'children': {}, 'top': []}
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def add(self, query, count=1):
+        query = normalize_query(query)
+        if not query:
+            return
+        with self._lock:
+            total = self.counts.get(query, 0) + count
+            self.counts[query] = total
+
+            node = self.root
+            self._update_top(node, query, total)
+            for ch in query:
+                node = node['children'].setdefault(ch, {'children': {}, 'top': []})
+                self._update_top(node, query, total)
+
+    def _update_top(self, node, query, total):
+        top = [entry for entry in node['top'] if entry[1] != query]
+        top.append((total, query))
+        top.sort(key=lambda entry: (-entry[0], entry[1]))
+        node['top'] = top[:self.top_k]
+
+    def complete(self, prefix, k=5):
+        """접두사로 시작하는 검색어를 많이 검색된 순서로 최대 k개"""
+        node = self.root
+        for ch in normalize_query(prefix):
+            node = node['children'].get(ch)
+            if node is None:
+                return []
+        return [query for _, query in node['top'][:k]]
+
+
+# ------------------------------------------------------------------------------
+# 검색 기록 (한 줄에 정규화된 검색어 하나) -> 트라이
+# ------------------------------------------------------------------------------
+QUERY_LOG_PATH = os.environ.get('QUERY_LOG_PATH', 'query_log.txt')
+
+
+class QueryLog:
+    def __init__(self, path=QUERY_LOG_PATH, top_k=10):
+        self.path = path
+        self.trie = QueryTrie(top_k=top_k)
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    self.trie.add(line.strip())
+
+    def record(self, query):
+        query = normalize_query(query)
+        if not query:
+            return
+        self.trie.add(query)
+        if self.path:
+            with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+                f.write(query + '\n')
+
+    def suggest(self, prefix, k=5):
+        return self.trie.complete(prefix, k)
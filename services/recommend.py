@@ -0,0 +1,129 @@
+import csv
+import random
+
+# ------------------------------------------------------------------------------
+# MBTI 추천 카탈로그 (진로/도서) + 가중치 샘플링용 Alias 테이블
+# ------------------------------------------------------------------------------
+# 카탈로그 CSV 형식: mbti,kind,item,weight
+#   kind = 'job'(진로) / 'book'(도서) / 'desc'(유형 설명, 첫 줄만 사용)
+CATALOG_PATH = 'pages/mbti_catalog.csv'
+ITEM_KINDS = ('job', 'book')
+
+
+class AliasTable:
+    """Vose Alias 방식: 만들 때 O(n), 한 번 뽑을 때 O(1)"""
+
+    def __init__(self, items, weights):
+        n = len(items)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("가중치가 양수인 항목이 하나 이상 필요합니다.")
+
+        self.items = list(items)
+        self.weights = list(weights)
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            lo = small.pop()
+            hi = large.pop()
+            self.prob[lo] = scaled[lo]
+            self.alias[lo] = hi
+            scaled[hi] = scaled[hi] + scaled[lo] - 1.0
+            if scaled[hi] < 1.0:
+                small.append(hi)
+            else:
+                large.append(hi)
+
+        # 부동소수점 오차로 남은 항목은 확률 1로 고정
+        for i in large + small:
+            self.prob[i] = 1.0
+
+    def __len__(self):
+        return len(self.items)
+
+    def sample_index(self, rng=random):
+        i = rng.randrange(len(self.items))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+    def sample(self, k, rng=random):
+        """중복 없이 가중치 비례로 최대 k개 추출 (가중치 높은 순으로 정렬해 반환)"""
+        n = len(self.items)
+        k = min(k, n)
+        picked = []
+        seen = set()
+
+        # k가 n보다 충분히 작으면 중복만 건너뛰는 방식으로 사실상 O(k)
+        attempts = 0
+        while len(picked) < k and attempts < k * 8:
+            i = self.sample_index(rng)
+            attempts += 1
+            if i not in seen:
+                seen.add(i)
+                picked.append(i)
+
+        # 남은 자리는 남은 항목 중에서 가중치 기반 무작위 키로 채움 (Efraimidis-Spirakis)
+        if len(picked) < k:
+            rest = [i for i in range(n) if i not in seen]
+            rest.sort(key=lambda i: rng.random() ** (1.0 / self.weights[i]), reverse=True)
+            picked += rest[:k - len(picked)]
+
+        picked.sort(key=lambda i: self.weights[i], reverse=True)
+        return [self.items[i] for i in picked]
+
+
+def load_catalog(path=CATALOG_PATH):
+    """카탈로그 CSV -> {mbti: {'desc': str, 'job': [(item, w)], 'book': [(item, w)]}}"""
+    catalog = {}
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            mbti = row['mbti'].strip().upper()
+            kind = row['kind'].strip()
+            item = row['item'].strip()
+            entry = catalog.setdefault(mbti, {'desc': '', 'job': [], 'book': []})
+
+            if kind == 'desc':
+                entry['desc'] = entry['desc'] or item
+            elif kind in ITEM_KINDS:
+                weight = float(row.get('weight') or 1)
+                if weight > 0:
+                    entry[kind].append((item, weight))
+    return catalog
+
+
+class Recommender:
+    """유형별/종류별 Alias 테이블을 미리 만들어두고 요청마다 top-k 추천"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.tables = {}
+        for mbti, entry in catalog.items():
+            for kind in ITEM_KINDS:
+                if entry[kind]:
+                    items, weights = zip(*entry[kind])
+                    self.tables[(mbti, kind)] = AliasTable(items, weights)
+
+    @classmethod
+    def from_csv(cls, path=CATALOG_PATH):
+        return cls(load_catalog(path))
+
+    def types(self):
+        # 카탈로그 파일에 적힌 순서 유지
+        return list(self.catalog.keys())
+
+    def describe(self, mbti):
+        return self.catalog.get(mbti, {}).get('desc', '')
+
+    def count(self, mbti, kind):
+        table = self.tables.get((mbti, kind))
+        return len(table) if table else 0
+
+    def recommend(self, mbti, kind, k, rng=random):
+        table = self.tables.get((mbti, kind))
+        if table is None:
+            return []
+        return table.sample(k, rng)
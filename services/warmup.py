@@ -0,0 +1,53 @@
+import importlib
+import threading
+import time
+
+# ------------------------------------------------------------------------------
+# 무거운 라이브러리 미리 불러오기 (백그라운드 스레드)
+# ------------------------------------------------------------------------------
+# 첫 화면(main2.py)과 가벼운 페이지는 이 모듈들을 import 하지 않으므로 (시작: main2.py)
+# 서버가 뜬 뒤 뒤에서 천천히 불러 두면 무거운 페이지의 첫 진입이 빨라짐
+HEAVY_MODULES = [
+    'numpy',
+    'pandas',
+    'matplotlib.pyplot',
+    'seaborn',
+    'plotly.graph_objects',
+]
+
+_lock = threading.Lock()
+_thread = None
+timings = {}
+
+
+def _warm(modules, extra_steps):
+    for name in modules:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        timings[name] = time.perf_counter() - started
+
+    for step in extra_steps:
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            continue
+        timings[step.__name__] = time.perf_counter() - started
+
+
+def start_prewarm(modules=None, extra_steps=()):
+    """프로세스당 한 번만 백그라운드 워밍업 스레드를 시작 (이미 시작했으면 그대로 반환)"""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(
+                target=_warm,
+                args=(list(modules or HEAVY_MODULES), list(extra_steps)),
+                name='prewarm',
+                daemon=True
+            )
+            _thread.start()
+        return _thread
@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+from services.datasets import get_dataset, registry
+from services.weather_data import TEMP_COLS, linear_trend, yearly_means
+
+# --------------------------------------------------------------------------------
+# weather02.py 기온 추세 그래프: 만든 Figure 를 서버 전체에서 캐시 (만들기만 건너뜀)
+# --------------------------------------------------------------------------------
+# - 키: (일별 데이터셋 버전, 지점, 해상도) -> 데이터가 다시 로드되면 자동으로 새로 만듦
+# - 같은 키면 모든 세션이 같은 Figure 객체를 공유 (읽기 전용, 페이지에서 수정 금지)
+# - 캐시로 줄어드는 것은 Figure 만들기(데이터 집계 + 트레이스 구성)뿐
+#   st.plotly_chart 는 그릴 때마다 Figure 를 복사/검사하고 JSON 으로 직렬화하므로 (일별은 ~1.4MB)
+#   직렬화 비용은 캐시 적중 때도 그대로 남음
+# - 점이 많으면 SVG 대신 WebGL(Scattergl) 트레이스로 그려 브라우저 렌더링 비용을 줄임
+RESOLUTIONS = {'year': '연평균', 'month': '월평균', 'day': '일별'}
+WEBGL_THRESHOLD = 2000   # 트레이스 점 개수가 이보다 많으면 Scattergl
+CACHE_SIZE = 32
+
+
+def yearly_series(yearly):
+    """yearly_means 결과 -> station_series(..., 'year') 와 같은 형식"""
+    yearly = yearly.dropna(subset=['Year'])
+    return yearly.assign(x=yearly['Year'].astype(int))[['x', 'Year', 'Avg_Temp']]
+
+
+def station_series(daily, station, resolution):
+    """지점 하나의 해상도별 평균기온 -> DataFrame(x, Year, Avg_Temp) (Year 는 추세선 계산용 소수 연도)"""
+    df = daily[daily['지점'] == station]
+    if resolution == 'year':
+        return yearly_series(yearly_means(df))
+
+    df = df.dropna(subset=['날짜'])
+    if resolution == 'month':
+        df = df.set_index('날짜')[TEMP_COLS].resample('MS').mean().reset_index()
+    elif resolution != 'day':
+        raise ValueError(f"지원하지 않는 해상도: {resolution}")
+    dates = df['날짜']
+    return df.assign(
+        x=dates,
+        Year=dates.dt.year + (dates.dt.dayofyear - 1) / 365.25,
+        Avg_Temp=df['평균기온(℃)'],
+    )[['x', 'Year', 'Avg_Temp']]
+
+
+def build_trend_figure(series, slope, intercept, resolution, webgl=None):
+    """관측값 + 추세선 그래프 (기존 weather02.py 레이아웃 그대로, webgl=None 이면 점 개수로 결정)"""
+    label = RESOLUTIONS[resolution]
+    if webgl is None:
+        webgl = len(series) > WEBGL_THRESHOLD
+    trace = go.Scattergl if webgl else go.Scatter
+    x_fmt = '%{x}년' if resolution == 'year' else '%{x|%Y-%m-%d}'
+
+    fig = go.Figure()
+
+    # A. 실제 관측 데이터 - 점이 많으면 선 없이 점만 (WebGL)
+    fig.add_trace(trace(
+        x=series['x'],
+        y=series['Avg_Temp'],
+        mode='markers+lines' if resolution == 'year' else 'markers',
+        name=f'{label} 기온 (Actual)',
+        marker=dict(size=6 if resolution == 'year' else 3, color='royalblue', opacity=0.5),
+        line=dict(width=1, color='royalblue'),
+        hovertemplate=x_fmt + ': %{y:.1f}℃'
+    ))
+
+    # B. 추세선 (연평균 기준 1차 회귀) - 직선이므로 연 단위가 아니면 양 끝점만
+    trend_x = series if resolution == 'year' else series.iloc[[0, -1]]
+    fig.add_trace(go.Scatter(
+        x=trend_x['x'],
+        y=slope * trend_x['Year'] + intercept,
+        mode='lines',
+        name='기온 상승 추세 (Trend)',
+        line=dict(color='red', width=4),
+        hovertemplate=x_fmt + ' 추세: %{y:.1f}℃'
+    ))
+
+    fig.update_layout(
+        title=dict(text=f'관측 이래 기온 변화 양상 ({label})', font=dict(size=20)),
+        xaxis_title='연도 (Year)',
+        yaxis_title='평균 기온 (℃)',
+        hovermode="x unified" if resolution == 'year' else "closest",
+        template='plotly_white',
+        legend=dict(yanchor="top", y=0.99, xanchor="left", x=0.01)
+    )
+    fig.update_yaxes(range=[series['Avg_Temp'].min() - 1, series['Avg_Temp'].max() + 1])
+    return fig
+
+
+def plot_trend_static(series, slope, intercept, resolution, ax):
+    """build_trend_figure 와 같은 그래프를 matplotlib 축에 (PNG/PDF 리포트용, plotly 정적 내보내기는 kaleido 필요)"""
+    label = RESOLUTIONS[resolution]
+    yearly = resolution == 'year'
+
+    ax.plot(series['x'], series['Avg_Temp'], marker='o', markersize=4 if yearly else 1,
+            linewidth=1 if yearly else 0, color='royalblue', alpha=0.5, label=f'{label} 기온 (Actual)')
+    trend_x = series if yearly else series.iloc[[0, -1]]
+    ax.plot(trend_x['x'], slope * trend_x['Year'] + intercept, color='red', linewidth=3,
+            label='기온 상승 추세 (Trend)')
+
+    ax.set_title(f'관측 이래 기온 변화 양상 ({label})', fontsize=15)
+    ax.set_xlabel('연도 (Year)', fontsize=12)
+    ax.set_ylabel('평균 기온 (℃)', fontsize=12)
+    ax.set_ylim(series['Avg_Temp'].min() - 1, series['Avg_Temp'].max() + 1)
+    ax.legend(loc='upper left')
+
+
+class FigureCache:
+    """키 -> {'figure', 'points', 'webgl', 'build_sec'} LRU"""
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None:
+                self._data.move_to_end(key)
+                return hit, True
+
+        started = time.perf_counter()
+        fig = build()
+        entry = {
+            'figure': fig,
+            'points': sum(len(t.x) for t in fig.data),
+            'webgl': any(t.type == 'scattergl' for t in fig.data),
+            'build_sec': time.perf_counter() - started,
+        }
+        with self._lock:
+            self._data[key] = entry
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return entry, False
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+cache = FigureCache()
+
+
+def trend_figure(station, resolution):
+    """(캐시 항목, 캐시 적중 여부) - 항목의 'figure' 를 st.plotly_chart 에 그대로 넘기면 됨"""
+    key = (registry.version('weather_daily'), station, resolution)
+
+    def build():
+        slope, intercept = linear_trend(get_dataset('weather_by_station')[station])
+        series = station_series(get_dataset('weather_daily'), station, resolution)
+        return build_trend_figure(series, slope, intercept, resolution)
+
+    return cache.get_or_build(key, build)
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+# --------------------------------------------------------------------------------
+# 기상청 일별 기온 데이터 (pages/ta_*.csv) 로드 및 연도별 집계
+# --------------------------------------------------------------------------------
+WEATHER_CSV_PATH = 'pages/ta_20251213130855.csv'
+TEMP_COLS = ['평균기온(℃)', '최저기온(℃)', '최고기온(℃)']
+
+
+def load_daily(file_path=WEATHER_CSV_PATH):
+    """일별 원본 데이터 정제: 날짜 파싱, 연도 추출, 기온 숫자 변환 (결측치는 그대로 둠)"""
+    # 인코딩 문제 해결을 위한 순차적 시도 (파일이 없으면 FileNotFoundError)
+    df = None
+    for enc in ['utf-8', 'cp949', 'euc-kr']:
+        try:
+            df = pd.read_csv(file_path, encoding=enc)
+            break
+        except UnicodeDecodeError:
+            continue
+    if df is None:
+        raise ValueError("지원하는 인코딩(utf-8, cp949, euc-kr)으로 파일을 읽을 수 없습니다.")
+
+    # 컬럼명 공백 제거
+    df.columns = df.columns.str.strip()
+
+    # '날짜' 컬럼 전처리: 데이터에 포함된 탭(\t)이나 따옴표(") 제거
+    if '날짜' in df.columns:
+        df['날짜'] = df['날짜'].astype(str).str.replace('\t', '').str.replace('"', '').str.strip()
+        df['날짜'] = pd.to_datetime(df['날짜'], errors='coerce')
+
+    # 연도 추출
+    df['Year'] = df['날짜'].dt.year
+
+    # 숫자형 변환 (에러 발생 시 NaN 처리)
+    for col in TEMP_COLS:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def yearly_extremes(daily):
+    """연도별 평균기온의 평균 + 절대 최저/최고 (weather.py 용, 결측 행은 제외)"""
+    df = daily.dropna(subset=['Year'] + TEMP_COLS)
+    df = df.assign(Year=df['Year'].astype(int))
+
+    yearly_df = df.groupby('Year').agg({
+        '평균기온(℃)': 'mean',
+        '최저기온(℃)': 'min',
+        '최고기온(℃)': 'max'
+    }).reset_index()
+
+    # 컬럼 이름 영문 변경 (Streamlit 차트 범례용)
+    yearly_df.columns = ['Year', 'Avg_Temp', 'Abs_Min_Temp', 'Abs_Max_Temp']
+    return yearly_df
+
+
+def yearly_means(daily):
+    """연도별 평균/최저/최고 기온의 평균 (weather02.py 용, 노이즈를 줄이고 추세를 보기 위함)"""
+    df_yearly = daily.groupby('Year')[TEMP_COLS].mean().reset_index()
+
+    # 컬럼명 영문 변환 (Plotly 등에서 다루기 쉽게)
+    df_yearly.columns = ['Year', 'Avg_Temp', 'Min_Temp', 'Max_Temp']
+    return df_yearly
+
+
+def linear_trend(df, x='Year', y='Avg_Temp'):
+    """1차 추세선 (y = slope * x + intercept) - 결측치가 있으면 계산이 안되므로 제외하고 계산"""
+    valid_idx = np.isfinite(df[x]) & np.isfinite(df[y])
+    slope, intercept = np.polyfit(df[x][valid_idx], df[y][valid_idx], 1)
+    return slope, intercept
+
+
+def yearly_by_station(daily):
+    """지점별 연평균 기온 {지점 번호: yearly_means 와 같은 형식} (여러 지점을 한 번에 조회할 때 사용)"""
+    return {int(station): yearly_means(group) for station, group in daily.groupby('지점')}
+
+
+def station_trends(by_station):
+    """지점별 추세 요약 (weather02.py KPI 와 같은 계산) - 유효한 연도가 2개 미만인 지점은 제외"""
+    trends = {}
+    for station, df in by_station.items():
+        valid = df.dropna(subset=['Year', 'Avg_Temp'])
+        if len(valid) < 2:
+            continue
+        slope, intercept = linear_trend(valid)
+        first, last = int(valid['Year'].min()), int(valid['Year'].max())
+        trends[station] = {
+            'station': station,
+            'first_year': first,
+            'last_year': last,
+            'years': len(valid),
+            'slope': float(slope),
+            'intercept': float(intercept),
+            'per_century': float(slope * 100),
+            'total_change': float(slope * (last - first)),
+        }
+    return trends
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 저장소 루트에서 services / tools 를 import (pages 와 같은 기준)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
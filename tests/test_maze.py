@@ -0,0 +1,107 @@
+import io
+import random
+import struct
+import zlib
+from collections import deque
+
+import pytest
+
+from services.maze import eller_rows, generate_maze, write_maze
+
+
+def reachable(tiles):
+    """(1, 1) 에서 통로(0)를 따라 갈 수 있는 타일 수"""
+    seen = {(1, 1)}
+    queue = deque(seen)
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if tiles[nr][nc] == 0 and (nr, nc) not in seen:
+                seen.add((nr, nc))
+                queue.append((nr, nc))
+    return len(seen)
+
+
+def open_tiles(tiles):
+    return sum(row.count(0) for row in tiles)
+
+
+# ------------------------------------------------------------------------------
+# Eller 스트리밍 미로: 모양 / 연결성 / 루프 없는 완전 미로
+# ------------------------------------------------------------------------------
+@pytest.mark.parametrize('width, height', [(1, 1), (1, 7), (7, 1), (12, 9), (30, 40)])
+@pytest.mark.parametrize('loop_prob', [0.0, 0.4, 1.0])
+def test_eller_rows_are_connected(width, height, loop_prob):
+    for seed in range(5):
+        tiles = [bytes(row) for row in eller_rows(width, height, loop_prob, random.Random(seed))]
+
+        assert len(tiles) == 2 * height + 1
+        assert all(len(row) == 2 * width + 1 for row in tiles)
+        # 바깥 테두리는 벽, 모든 칸은 통로
+        assert tiles[0].count(1) == tiles[-1].count(1) == 2 * width + 1
+        assert all(row[0] == row[-1] == 1 for row in tiles)
+        assert all(tiles[2 * r + 1][2 * c + 1] == 0 for r in range(height) for c in range(width))
+        # 모든 통로가 한 덩어리
+        assert reachable(tiles) == open_tiles(tiles)
+
+
+@pytest.mark.parametrize('width, height', [(5, 5), (16, 3), (25, 25)])
+def test_eller_without_braid_is_a_perfect_maze(width, height):
+    # 연결되어 있고 통로(칸 사이 벽 없음)가 칸 수 - 1 개면 루프가 없는 트리
+    tiles = [bytes(row) for row in eller_rows(width, height, 0.0, random.Random(3))]
+    passages = open_tiles(tiles) - width * height
+    assert passages == width * height - 1
+    assert reachable(tiles) == open_tiles(tiles)
+
+
+def test_braid_removes_dead_ends():
+    def dead_ends(tiles, width, height):
+        count = 0
+        for r in range(height):
+            for c in range(width):
+                y, x = 2 * r + 1, 2 * c + 1
+                if (tiles[y - 1][x], tiles[y + 1][x], tiles[y][x - 1], tiles[y][x + 1]).count(0) == 1:
+                    count += 1
+        return count
+
+    perfect = [bytes(row) for row in eller_rows(30, 30, 0.0, random.Random(5))]
+    braided = [bytes(row) for row in eller_rows(30, 30, 1.0, random.Random(5))]
+    assert dead_ends(braided, 30, 30) < dead_ends(perfect, 30, 30)
+
+
+def test_write_maze_png_matches_rows():
+    width, height = 37, 11
+    out = io.BytesIO()
+    assert write_maze(out, width, height, 0.4, seed=9, fmt='png') == 2 * height + 1
+
+    data = out.getvalue()
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    pos, idat = 8, b''
+    while pos < len(data):
+        (length,), kind = struct.unpack('>I', data[pos:pos + 4]), data[pos + 4:pos + 8]
+        chunk = data[pos + 8:pos + 8 + length]
+        assert struct.unpack('>I', data[pos + 8 + length:pos + 12 + length])[0] == zlib.crc32(kind + chunk)
+        if kind == b'IDAT':
+            idat += chunk
+        pos += 12 + length
+
+    raw = zlib.decompress(idat)
+    stride = 1 + (2 * width + 1 + 7) // 8
+    expected = [bytes(row) for row in eller_rows(width, height, 0.4, random.Random(9))]
+    for i, row in enumerate(expected):
+        line = raw[i * stride:(i + 1) * stride]
+        assert line[0] == 0
+        bits = ''.join(f'{b:08b}' for b in line[1:])[:len(row)]
+        assert bits == ''.join('0' if t else '1' for t in row)  # PNG: 1 = 흰색(통로)
+
+
+def test_write_maze_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        write_maze(io.BytesIO(), 3, 3, fmt='gif')
+
+
+@pytest.mark.parametrize('grid', [1, 5, 20])
+def test_generate_maze_is_connected(grid):
+    tiles = generate_maze(grid, 0.4, random.Random(grid))
+    assert len(tiles) == 2 * grid + 1
+    assert reachable(tiles) == open_tiles(tiles)
@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+from services.price_search import ADAPTER_CLASSES, PriceAggregator, ShopAdapter, default_adapters
+from tools.standin_server import SHOP_BASE_PRICE, SHOP_DELAYS, start_standin_server, standin_base_urls
+
+
+# ------------------------------------------------------------------------------
+# 로컬 대역 서버(tools/standin_server.py)로 5개 쇼핑몰 동시 검색 확인
+# ------------------------------------------------------------------------------
+@pytest.fixture(scope='module')
+def standin_port():
+    server, port = start_standin_server()
+    yield port
+    server.shutdown()
+
+
+@pytest.fixture
+def make_aggregator(standin_port):
+    created = []
+
+    def make(adapters=None, **kwargs):
+        agg = PriceAggregator(adapters or default_adapters(standin_base_urls(standin_port)), **kwargs)
+        created.append(agg)
+        return agg
+
+    yield make
+    for agg in created:
+        agg.close()
+
+
+def test_parses_every_shop_and_sorts_by_price(make_aggregator, standin_port):
+    merged, status = make_aggregator().search('신라면 1+1')
+
+    assert [s['status'] for s in status] == ['ok'] * len(ADAPTER_CLASSES)
+    assert [s['count'] for s in status] == [5] * len(ADAPTER_CLASSES)
+    assert len(merged) == 5 * len(ADAPTER_CLASSES)
+
+    prices = [item['price'] for item in merged]
+    assert prices == sorted(prices)
+    assert prices[0] == min(SHOP_BASE_PRICE.values())
+
+    # 상대 경로 상품 링크는 쇼핑몰 주소 기준 절대 URL 로
+    assert all(item['url'].startswith(f'http://127.0.0.1:{standin_port}/') for item in merged)
+    # 검색어는 퍼센트 인코딩되어 그대로 전달됨
+    assert all(item['title'].startswith('신라면 1+1 ') for item in merged)
+
+
+def test_slow_shop_times_out_without_blocking_others(make_aggregator, standin_port):
+    adapters = default_adapters(standin_base_urls(standin_port))
+    slow = next(a for a in adapters if a.name == 'lotte')
+    slow.timeout = SHOP_DELAYS['lotte'] / 5
+
+    merged, status = make_aggregator(adapters).search('새우깡')
+    by_shop = {s['shop']: s for s in status}
+
+    assert by_shop[slow.label]['status'] == 'timeout'
+    assert by_shop[slow.label]['count'] == 0
+    assert all(s['status'] == 'ok' for s in status if s['shop'] != slow.label)
+    assert len(merged) == 5 * (len(ADAPTER_CLASSES) - 1)
+
+
+def test_http_error_is_reported_per_shop(make_aggregator, standin_port):
+    adapters = default_adapters(standin_base_urls(standin_port))
+    adapters[0].base_url = f'http://127.0.0.1:{standin_port}/no-such-shop'  # 대역 서버가 404
+
+    _, status = make_aggregator(adapters).search('과자')
+
+    assert status[0]['status'] == 'error: HTTPStatusError'
+    assert all(s['status'] == 'ok' for s in status[1:])
+
+
+def test_empty_and_failed_results_are_cached(make_aggregator, standin_port):
+    class EmptyShop(ShopAdapter):
+        name, label = 'empty', 'empty'
+        search_path = '/search?q={q}'
+
+        def parse(self, html):
+            return []
+
+    empty = make_aggregator([EmptyShop(base_url=f'http://127.0.0.1:{standin_port}/coupang')])
+    merged, status = empty.search('없는 상품')
+    assert merged == [] and [s['status'] for s in status] == ['ok']
+    assert empty.cache.get('없는 상품') == (merged, status)
+
+    dead = ShopAdapter(base_url=f'http://127.0.0.1:{standin_port}/no-such-shop')
+    failing = make_aggregator([dead], failure_ttl=60)
+    failing.search('x')
+    assert failing.cache.get('x') is not None
+
+
+def test_overall_timeout_reports_every_shop(make_aggregator):
+    agg = make_aggregator()
+    for adapter in agg.adapters:
+        adapter.timeout = 0.05
+    agg._loop.call_soon_threadsafe(time.sleep, 1.5)  # 이벤트 루프가 전체 대기 시간보다 오래 막힌 경우
+
+    merged, status = agg.search('라면')
+
+    assert merged == []
+    assert [s['status'] for s in status] == ['timeout'] * len(ADAPTER_CLASSES)
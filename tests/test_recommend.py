@@ -0,0 +1,68 @@
+import os
+import random
+from collections import Counter
+
+import pytest
+
+from services.recommend import CATALOG_PATH, AliasTable, Recommender, load_catalog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WEIGHTS = {'a': 5, 'b': 3, 'c': 1, 'd': 1}
+
+
+# ------------------------------------------------------------------------------
+# Alias 테이블: 한 번 뽑기 = 가중치 비례, 여러 개 뽑기 = 중복 없이
+# ------------------------------------------------------------------------------
+def test_sample_index_follows_weights():
+    table = AliasTable(list(WEIGHTS), list(WEIGHTS.values()))
+    rng = random.Random(1)
+    draws = 50_000
+    counts = Counter(table.items[table.sample_index(rng)] for _ in range(draws))
+
+    total = sum(WEIGHTS.values())
+    for item, weight in WEIGHTS.items():
+        assert counts[item] / draws == pytest.approx(weight / total, abs=0.01)
+
+
+@pytest.mark.parametrize('k', [1, 2, 3, 4])
+def test_sample_without_replacement(k):
+    table = AliasTable(list(WEIGHTS), list(WEIGHTS.values()))
+    rng = random.Random(k)
+    for _ in range(200):
+        picked = table.sample(k, rng)
+        assert len(picked) == k
+        assert len(set(picked)) == k
+        # 가중치 높은 순으로 정렬해서 반환
+        assert [WEIGHTS[i] for i in picked] == sorted((WEIGHTS[i] for i in picked), reverse=True)
+
+
+def test_sample_clamps_k_and_fills_skewed_tables():
+    # 한 항목이 거의 모든 확률을 차지해도 (중복 건너뛰기만으로는 못 채움) k개를 채움
+    table = AliasTable(['big', 'x', 'y', 'z'], [10_000, 1, 1, 1])
+    picked = table.sample(10, random.Random(0))
+    assert sorted(picked) == ['big', 'x', 'y', 'z']
+    assert picked[0] == 'big'
+
+
+def test_first_pick_follows_weights():
+    table = AliasTable(list(WEIGHTS), list(WEIGHTS.values()))
+    rng = random.Random(7)
+    draws = 20_000
+    counts = Counter(table.sample(1, rng)[0] for _ in range(draws))
+    assert counts['a'] / draws == pytest.approx(0.5, abs=0.02)
+
+
+@pytest.mark.parametrize('weights', [[], [0, 0]])
+def test_rejects_tables_without_positive_weight(weights):
+    with pytest.raises(ValueError):
+        AliasTable(['x'] * len(weights), weights)
+
+
+def test_recommender_uses_bundled_catalog():
+    recommender = Recommender(load_catalog(os.path.join(ROOT, CATALOG_PATH)))
+    mbti = recommender.types()[0]
+    k = recommender.count(mbti, 'book')
+    books = recommender.recommend(mbti, 'book', k + 3, random.Random(0))
+    assert len(books) == len(set(books)) == k
+    assert recommender.recommend('XXXX', 'job', 3) == []
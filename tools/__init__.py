@@ -0,0 +1 @@
+"""로컬 개발/측정용 스크립트 모음 (python -m tools.<이름> 으로 실행)"""
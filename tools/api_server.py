@@ -0,0 +1,126 @@
+"""대시보드 계산 결과 조회용 로컬 HTTP/JSON API 서버
+
+    python -m tools.api_server --port 8780
+    curl 'http://127.0.0.1:8780/weather/trend?station=108'
+    curl 'http://127.0.0.1:8780/mbti/country?country=대한민국,일본'
+    curl -X POST http://127.0.0.1:8780/batch \\
+         -d '{"requests": [{"path": "/weather/trend"}, {"path": "/mbti/rank", "params": {"type": "INTJ-A"}}]}'
+
+경로 목록은 /endpoints, 계산 로직과 캐시는 services/api.py 참고
+Streamlit 서버와 별도 프로세스로 띄워서 다른 프로그램의 조회가 화면 응답을 느리게 하지 않도록 함
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+from services import api
+from services.datasets import registry
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAX_BODY = 1 << 20
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive (벤치마크/배치 클라이언트가 연결을 재사용)
+    # 헤더와 본문을 따로 보내므로 Nagle 알고리즘을 끄지 않으면 keep-alive 응답마다 ~40ms 지연
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        try:
+            etag, body = api.handle(parsed.path, dict(parse_qsl(parsed.query)))
+        except api.ApiError as e:
+            return self._send_error(e)
+        except Exception:
+            return self._send_internal_error()
+        self._send_json(200, body, etag)
+
+    def do_POST(self):
+        if urlparse(self.path).path != '/batch':
+            return self._send_error(api.ApiError(404, f"없는 경로: {self.path}"))
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            if length > MAX_BODY:
+                raise api.ApiError(413, "요청 본문이 너무 큽니다")
+            try:
+                payload = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                raise api.ApiError(400, "JSON 본문을 읽을 수 없습니다")
+            body = api.handle_batch(payload.get('requests') if isinstance(payload, dict) else None)
+        except api.ApiError as e:
+            return self._send_error(e)
+        except Exception:
+            return self._send_internal_error()
+        self._send_json(200, body, api.make_etag(body))
+
+    def _send_json(self, code, body, etag=None):
+        if etag and etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')  # 매번 ETag 로 다시 확인
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, error):
+        self._send_json(error.status, api.encode({'error': error.message}))
+
+    def _send_internal_error(self):
+        # 예상하지 못한 오류도 연결을 끊지 않고 JSON 500 으로 응답
+        traceback.print_exc()
+        self._send_error(api.ApiError(500, "서버 내부 오류"))
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_api_server(port=0, host='127.0.0.1'):
+    """백그라운드 스레드로 서버 시작 -> (server, 실제 포트)"""
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8780)
+    parser.add_argument('--cache-size', type=int, default=1024, help='응답 캐시 항목 수 (0 = 캐시 끔)')
+    parser.add_argument('--weather-csv', help='일별 기온 CSV 경로 (기본: 번들 파일)')
+    parser.add_argument('--no-warm-up', action='store_true', help='시작할 때 데이터셋을 미리 로드하지 않음')
+    args = parser.parse_args(argv)
+
+    if args.weather_csv:
+        registry.spec('weather_daily').path = os.path.abspath(args.weather_csv)
+    os.chdir(ROOT)  # 데이터셋 경로가 저장소 루트 기준 상대 경로
+    api.cache.maxsize = args.cache_size
+    if not args.no_warm_up:
+        failed = registry.warm_up({name for ep in api.ENDPOINTS.values() for name in ep.datasets})
+        for name, error in failed.items():
+            print(f"warm-up 실패: {name} ({error})", file=sys.stderr)
+
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    server.daemon_threads = True
+    print(f"api server: http://{args.host}:{server.server_address[1]}/endpoints", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
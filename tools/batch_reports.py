@@ -0,0 +1,337 @@
+"""국가별 MBTI / 지점별 기온 추세 인쇄용 리포트 일괄 생성 (PNG/HTML/PDF, 프로세스 풀)
+
+    python -m tools.batch_reports                              # reports/ 에 전체 (입력이 바뀐 것만)
+    python -m tools.batch_reports --formats png pdf --workers 4
+    python -m tools.batch_reports --kinds mbti -k 대한민국 --force
+    python -m tools.batch_reports --weather-csv other_stations.csv
+
+화면과 같은 계산/그래프 함수를 그대로 사용 (services/mbti_data.py, mbti_charts.py, weather_data.py, weather_charts.py)
+  - 부모 프로세스: 데이터셋을 한 번만 로드해서 리포트별 입력(작은 dict)과 입력 해시를 만듦
+  - 작업 프로세스: 시작할 때 한 번만 matplotlib(Agg) + 한글 폰트를 설정하고, 이후에는 입력만 받아서 그림
+  - 입력 해시가 manifest.json 과 같고 요청한 형식의 파일이 모두 있으면 건너뜀 (--force 로 전부 다시)
+기온 HTML 은 weather02.py 와 같은 Plotly 그래프(plotly.min.js 는 출력 폴더에 한 번만 저장),
+PNG/PDF 는 같은 데이터를 matplotlib 으로 그림 (Plotly 정적 이미지 내보내기에는 kaleido 가 필요)
+결과: reports/{mbti,weather}/<이름>.{png,html,pdf}, reports/index.html, reports/manifest.json
+"""
+import argparse
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from services.datasets import get_dataset, registry
+from services.mbti_data import country_distribution
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(ROOT, 'reports')
+FORMATS = ('png', 'html', 'pdf')
+KINDS = ('mbti', 'weather')
+RENDER_VERSION = 1   # 리포트 레이아웃을 바꾸면 올림 -> 입력이 같아도 전부 다시 생성
+PAGE_SIZE = (8.27, 11.69)   # A4 세로 (인치)
+DPI = 150
+UNSAFE_CHARS = re.compile(r'[\\/:*?"<>|]')   # 파일 이름에 쓸 수 없는 문자
+
+HTML_PAGE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{title}</title>{head}
+<style>
+body {{ font-family: 'NanumGothic', sans-serif; max-width: 900px; margin: 2em auto; }}
+table {{ border-collapse: collapse; }} td, th {{ border: 1px solid #ccc; padding: 2px 8px; text-align: right; }}
+img {{ max-width: 100%; }} @media print {{ body {{ margin: 0; }} }}
+</style></head>
+<body><h1>{title}</h1>{body}</body></html>
+"""
+
+
+# ------------------------------------------------------------------------------
+# 작업 목록 (부모 프로세스): 리포트 하나 = {'kind', 'name', 'inputs'}
+# ------------------------------------------------------------------------------
+def mbti_jobs():
+    df = get_dataset('mbti')
+    ranks = get_dataset('mbti_ranks')
+    jobs = []
+    for country in df['Country'].unique():
+        distribution = country_distribution(df, country)
+        jobs.append({'kind': 'mbti', 'name': str(country), 'inputs': {
+            'country': str(country),
+            'countries': len(df),
+            'distribution': {t: float(v) for t, v in distribution.items()},
+            'ranks': {t: int(r) for t, r in ranks.loc[country, distribution.index].items()},
+        }})
+    return jobs
+
+
+def weather_jobs():
+    by_station = get_dataset('weather_by_station')
+    jobs = []
+    for station, trend in get_dataset('weather_station_trends').items():
+        yearly = by_station[station].dropna(subset=['Year'])
+        jobs.append({'kind': 'weather', 'name': str(station), 'inputs': {
+            'station': station,
+            'trend': trend,
+            'yearly': {'Year': yearly['Year'].astype(int).tolist(), 'Avg_Temp': yearly['Avg_Temp'].tolist()},
+        }})
+    return jobs
+
+
+JOB_BUILDERS = {'mbti': mbti_jobs, 'weather': weather_jobs}
+
+
+def input_hash(job):
+    payload = json.dumps([RENDER_VERSION, job['kind'], job['inputs']], sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def report_key(job):
+    """출력 경로 (확장자 제외)"""
+    return f"{job['kind']}/{UNSAFE_CHARS.sub('_', job['name'])}"
+
+
+# ------------------------------------------------------------------------------
+# 작업 프로세스
+# ------------------------------------------------------------------------------
+def init_worker():
+    """프로세스마다 한 번: 화면 없는 백엔드 + 한글 폰트/스타일"""
+    import warnings
+
+    import matplotlib
+    matplotlib.use('Agg')
+    warnings.filterwarnings('ignore', category=FutureWarning)  # seaborn palette 경고가 진행 표시를 가림
+
+    from services.plotting import setup_korean_font
+    setup_korean_font()
+
+
+def render_mbti(inputs):
+    """국가 리포트 -> (matplotlib Figure, 제목, HTML 본문)"""
+    import matplotlib.pyplot as plt
+
+    from services.mbti_charts import plot_pie_chart, plot_type_bar
+
+    country = inputs['country']
+    distribution = pd.Series(inputs['distribution'])
+    top_type, top_val = distribution.index[0], distribution.iloc[0]
+    rank, countries = inputs['ranks'][top_type], inputs['countries']
+    summary = (f"가장 흔한 유형은 {top_type}이며, 약 {top_val * 100:.1f}%를 차지합니다. "
+               f"(이 유형 비율 세계 {rank}위 / {countries}개국)")
+
+    title = f"{country} MBTI 성향 리포트"
+    fig = plt.figure(figsize=PAGE_SIZE)
+    grid = fig.add_gridspec(2, 1, height_ratios=[4, 5], top=0.88, bottom=0.03, hspace=0.3)
+    fig.text(0.5, 0.96, title, ha='center', fontsize=20, fontweight='bold')
+    fig.text(0.5, 0.935, summary, ha='center', fontsize=11)
+    plot_type_bar(distribution, f"{country}의 MBTI 유형 분포", fig.add_subplot(grid[0]), "magma")
+    plot_pie_chart(distribution, f"{country} 상위 8개 유형", fig.add_subplot(grid[1]))
+
+    rows = ''.join(f"<tr><td>{html.escape(t)}</td><td>{v * 100:.2f}%</td><td>{inputs['ranks'][t]}위</td></tr>"
+                   for t, v in distribution.items())
+    body = (f"<p>{html.escape(summary)}</p>{{figure}}"
+            f"<h2>유형별 비율과 세계 순위</h2><table><tr><th>유형</th><th>비율</th><th>순위</th></tr>{rows}</table>")
+    return fig, title, body
+
+
+def render_weather(inputs):
+    """지점 리포트 -> (matplotlib Figure, 제목, HTML 본문) - KPI 는 weather02.py 와 같은 문구"""
+    import matplotlib.pyplot as plt
+
+    from services.weather_charts import build_trend_figure, plot_trend_static, yearly_series
+
+    trend = inputs['trend']
+    series = yearly_series(pd.DataFrame(inputs['yearly']))
+    kpis = [
+        ("분석 기간", f"{trend['first_year']}년 ~ {trend['last_year']}년", f"{trend['years']}년 데이터"),
+        ("100년당 기온 상승률", f"{trend['per_century']:.2f} ℃", "매우 빠름" if trend['per_century'] > 1.0 else "보통"),
+        ("총 기온 상승 (추세선 기준)", f"{trend['total_change']:.2f} ℃", "상승 중" if trend['slope'] > 0 else "하강 중"),
+    ]
+
+    title = f"{inputs['station']} 지점 기온 추세 리포트"
+    fig = plt.figure(figsize=PAGE_SIZE)
+    fig.text(0.5, 0.96, title, ha='center', fontsize=20, fontweight='bold')
+    for i, (label, value, delta) in enumerate(kpis):
+        x = (i + 0.5) / len(kpis)
+        fig.text(x, 0.89, label, ha='center', fontsize=11, color='gray')
+        fig.text(x, 0.86, value, ha='center', fontsize=18, fontweight='bold')
+        fig.text(x, 0.835, delta, ha='center', fontsize=10)
+    fig.subplots_adjust(top=0.76, bottom=0.08)
+    plot_trend_static(series, trend['slope'], trend['intercept'], 'year', fig.add_subplot())
+
+    chart = build_trend_figure(series, trend['slope'], trend['intercept'], 'year')
+    cells = ''.join(f"<td><small>{label}</small><br><b>{value}</b><br>{delta}</td>" for label, value, delta in kpis)
+    body = (f"<table><tr>{cells}</tr></table>"
+            + chart.to_html(full_html=False, include_plotlyjs=False, default_width='100%'))
+    return fig, title, body
+
+
+RENDERERS = {'mbti': render_mbti, 'weather': render_weather}
+
+
+def render_report(job, key, out_dir, formats):
+    """리포트 하나를 요청한 형식으로 저장 -> (key, 저장한 파일 목록, 걸린 시간)"""
+    import matplotlib.pyplot as plt
+
+    started = time.perf_counter()
+    base = os.path.join(out_dir, key)
+    os.makedirs(os.path.dirname(base), exist_ok=True)
+    fig, title, body = RENDERERS[job['kind']](job['inputs'])
+    try:
+        # PNG 는 한 번만 그려서 파일과 HTML(국가 리포트) 양쪽에 사용
+        png = None
+        if 'png' in formats or (job['kind'] == 'mbti' and 'html' in formats):
+            buf = io.BytesIO()
+            fig.savefig(buf, format='png', dpi=DPI)
+            png = buf.getvalue()
+
+        files = []
+        for fmt in formats:
+            path = f'{base}.{fmt}'
+            if fmt == 'png':
+                with open(path, 'wb') as f:
+                    f.write(png)
+            elif fmt == 'pdf':
+                fig.savefig(path)
+            else:
+                if job['kind'] == 'mbti':
+                    # 그래프 PNG 를 HTML 안에 넣어서 파일 하나로 인쇄/공유할 수 있게
+                    img = base64.b64encode(png).decode('ascii')
+                    page_body, head = body.replace('{figure}', f'<img src="data:image/png;base64,{img}">'), ''
+                else:
+                    page_body, head = body, '<script src="../plotly.min.js"></script>'
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(HTML_PAGE.format(title=html.escape(title), head=head, body=page_body))
+            files.append(f'{key}.{fmt}')
+    finally:
+        plt.close(fig)
+    return key, files, time.perf_counter() - started
+
+
+# ------------------------------------------------------------------------------
+# 증분 생성 기록 + 목차
+# ------------------------------------------------------------------------------
+def load_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def is_up_to_date(manifest, key, digest, out_dir, formats):
+    entry = manifest.get(key)
+    return (entry is not None and entry['hash'] == digest
+            and all(os.path.exists(os.path.join(out_dir, f'{key}.{fmt}')) for fmt in formats))
+
+
+def merge_files(entry, digest, files, out_dir):
+    """이번에 만든 파일 + 같은 입력으로 예전에 만든 다른 형식 파일 (--formats 를 좁혀 다시 돌려도 목차에 남김)"""
+    if entry is None or entry['hash'] != digest:
+        return files
+    kept = [f for f in entry['files'] if f not in files and os.path.exists(os.path.join(out_dir, f))]
+    return kept + files
+
+
+def write_index(out_dir, manifest):
+    sections = []
+    for kind, title in [('mbti', '국가별 MBTI 성향'), ('weather', '지점별 기온 추세')]:
+        keys = sorted(k for k in manifest if k.startswith(kind + '/'))
+        if not keys:
+            continue
+        items = ''.join(
+            f"<li>{html.escape(k.split('/', 1)[1])}: "
+            + ' '.join(f'<a href="{html.escape(f)}">{f.rsplit(".", 1)[1]}</a>' for f in manifest[k]['files'])
+            + '</li>' for k in keys)
+        sections.append(f'<h2>{title}</h2><ul>{items}</ul>')
+    with open(os.path.join(out_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(HTML_PAGE.format(title='리포트 목록', head='', body=''.join(sections)))
+
+
+# ------------------------------------------------------------------------------
+# 실행
+# ------------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=list(KINDS))
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS))
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='작업 프로세스 수')
+    parser.add_argument('-k', '--filter', default='', help='이름에 이 문자열이 들어간 리포트만')
+    parser.add_argument('--force', action='store_true', help='입력이 그대로여도 전부 다시 생성')
+    parser.add_argument('--weather-csv', help='일별 기온 CSV 경로 (기본: 번들 파일)')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    out_dir = os.path.abspath(args.output)
+    if args.weather_csv:
+        registry.spec('weather_daily').path = os.path.abspath(args.weather_csv)
+    os.chdir(ROOT)  # 데이터셋/폰트 경로가 저장소 루트 기준 상대 경로
+
+    started = time.perf_counter()
+    jobs = []
+    for kind in args.kinds:
+        try:
+            jobs += [job for job in JOB_BUILDERS[kind]() if args.filter in job['name']]
+        except (FileNotFoundError, ValueError) as e:
+            print(f"{kind}: 데이터를 읽을 수 없어 건너뜀 ({e})", file=sys.stderr)
+    prepared = time.perf_counter() - started
+
+    manifest_path = os.path.join(out_dir, 'manifest.json')
+    manifest = load_manifest(manifest_path)
+    pending = []
+    for job in jobs:
+        key, digest = report_key(job), input_hash(job)
+        if args.force or not is_up_to_date(manifest, key, digest, out_dir, args.formats):
+            pending.append((job, key, digest))
+    print(f"리포트 {len(jobs)}개 (입력 준비 {prepared:.2f}s) -> 새로 생성 {len(pending)}개, "
+          f"변경 없음 {len(jobs) - len(pending)}개", flush=True)
+
+    os.makedirs(out_dir, exist_ok=True)
+    if 'html' in args.formats and any(job['kind'] == 'weather' for job, _, _ in pending):
+        from plotly.offline import get_plotlyjs
+        with open(os.path.join(out_dir, 'plotly.min.js'), 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+
+    from services.plotting import ensure_font_file
+    ensure_font_file()  # 작업 프로세스들이 동시에 내려받지 않도록 먼저
+
+    failed, busy = [], 0.0
+    render_started = time.perf_counter()
+    try:
+        if pending:
+            digests = {key: digest for _, key, digest in pending}
+            with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(pending))),
+                                     initializer=init_worker) as pool:
+                futures = {pool.submit(render_report, job, key, out_dir, args.formats): key
+                           for job, key, _ in pending}
+                for done, future in enumerate(as_completed(futures), 1):
+                    key = futures[future]
+                    try:
+                        _, files, seconds = future.result()
+                    except Exception as e:
+                        failed.append(key)
+                        print(f"[{done}/{len(pending)}] {key} 실패: {type(e).__name__}: {e}", file=sys.stderr)
+                        continue
+                    busy += seconds
+                    manifest[key] = {'hash': digests[key],
+                                     'files': merge_files(manifest.get(key), digests[key], files, out_dir)}
+                    elapsed = time.perf_counter() - render_started
+                    print(f"[{done}/{len(pending)}] {key} ({seconds:.2f}s) - {done / elapsed:.1f}개/s", flush=True)
+    finally:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        write_index(out_dir, manifest)
+
+    wall = time.perf_counter() - render_started
+    rendered = len(pending) - len(failed)
+    if rendered:
+        print(f"\n완료: {rendered}개 {wall:.1f}s ({rendered / wall:.1f}개/s, 리포트당 평균 {busy / rendered:.2f}s), "
+              f"실패 {len(failed)}개 -> {out_dir}/index.html")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""페이지별 첫 실행 시간 + import 시간 리포트 (AppTest, python -X importtime 기반)
+
+    python -m tools.importtime_report                     # 표준 출력
+    python -m tools.importtime_report -o docs/importtime.md
+    python -m tools.importtime_report --baseline 4c70dd5 -o docs/importtime.md   # 변경 전과 비교
+
+- 첫 실행: 새 프로세스에서 streamlit 을 불러 둔 뒤 AppTest.from_file(page).run() 한 번의 벽시계 시간
+  (서버가 뜬 뒤 그 페이지를 처음 여는 경우 = 페이지 import + 데이터 로드 + 그리기 + 워밍업 스레드와의 경합)
+- import: 각 페이지 파일의 최상위 import 문만 모아 새 프로세스에서 실행하고
+  -X importtime 출력에서 최상위 모듈별 누적 시간(cumulative)을 집계 (함수 안의 늦은 import 는 제외되므로
+  첫 실행 시간과 같이 봐야 함)
+--baseline 을 주면 그 커밋의 트리(git archive)에서도 같은 페이지를 측정해 "변경 전" 열로 같이 보여줌
+출력 파일에 NOTES_MARKER 아래로 적어 둔 내용(결과 해석)은 다시 생성해도 그대로 남김
+"""
+import argparse
+import ast
+import glob
+import json
+import shutil
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PAGE_FILES = ['main2.py'] + sorted(glob.glob('pages/*.py'))
+SHARED_MODULES = {'streamlit'}  # 모든 페이지가 공통으로 내는 비용
+NOTES_MARKER = '<!-- 아래는 직접 작성 (다시 생성해도 유지) -->'
+# 로컬에만 있는 파일 (git archive 에 없음) - 변경 전 트리에도 복사해서 같은 조건으로 측정
+LOCAL_FILES = ['NanumGothic.ttf']
+
+_FIRST_RUN = """
+import json, sys, time, warnings
+warnings.filterwarnings('ignore')
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+started = time.perf_counter()
+at.run()
+print(json.dumps({'sec': time.perf_counter() - started, 'error': bool(at.exception)}))
+"""
+
+
+def top_level_imports(path, root='.'):
+    """파일의 최상위(모듈 레벨) import 문을 소스 문자열 그대로 반환"""
+    with open(os.path.join(root, path), encoding='utf-8') as f:
+        source = f.read()
+    tree = ast.parse(source)
+    lines = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            lines.append(ast.get_source_segment(source, node))
+    return lines
+
+
+def measure(import_lines, python=sys.executable, root='.'):
+    """새 프로세스에서 import 실행 -> {최상위 모듈: 누적 마이크로초}"""
+    proc = subprocess.run(
+        [python, '-X', 'importtime', '-c', '\n'.join(import_lines)],
+        capture_output=True, text=True, cwd=root
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    startup = _startup_modules(python)
+    result = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        name = name.rstrip()[1:]
+        # 들여쓰기가 없는 줄 = 이 import 문이 직접 불러온 최상위 모듈
+        if name == name.lstrip() and name not in startup:
+            result[name] = result.get(name, 0) + int(cumulative)
+    return result
+
+
+_startup_cache = {}
+
+
+def _startup_modules(python):
+    """인터프리터 시작 시 항상 불러오는 모듈(site, encodings 등)은 페이지 비용에서 제외"""
+    if python not in _startup_cache:
+        proc = subprocess.run([python, '-X', 'importtime', '-c', 'pass'], capture_output=True, text=True)
+        _startup_cache[python] = {line.split('|')[2].strip() for line in proc.stderr.splitlines()
+                                  if line.startswith('import time:') and 'cumulative' not in line}
+    return _startup_cache[python]
+
+
+def first_run(path, python=sys.executable, root='.'):
+    """새 프로세스에서 페이지를 처음 한 번 실행하는 시간(초)과 예외 여부"""
+    proc = subprocess.run([python, '-c', _FIRST_RUN, path], capture_output=True, text=True, cwd=root)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return result['sec'], result['error']
+
+
+def page_report(path, repeat, root='.'):
+    """{'modules': {모듈: 마이크로초}, 'total': 마이크로초, 'first_run': 초, 'error': 첫 실행 중 예외 여부}"""
+    runs = [first_run(path, root=root) for _ in range(repeat)]
+    return _report(path, root, repeat, runs)
+
+
+def _report(path, root, repeat, first_runs):
+    report = {'first_run': statistics.median(sec for sec, _ in first_runs),
+              'error': any(err for _, err in first_runs), 'modules': {}, 'total': 0.0}
+    lines = top_level_imports(path, root)
+    if lines:
+        runs = [measure(lines, root=root) for _ in range(repeat)]
+        report['modules'] = {name: statistics.median(run.get(name, 0) for run in runs) for name in runs[0]}
+        report['total'] = sum(report['modules'].values())
+    return report
+
+
+def compare_reports(rev, pages, repeat):
+    """커밋 rev 의 트리를 임시 폴더에 풀어서 같은 페이지들을 측정 -> (현재 리포트, 변경 전 리포트)
+
+    첫 실행 시간은 기계 상태에 따라 흔들리므로 현재/변경 전을 번갈아 실행해서 같은 조건으로 비교
+    (변경 전 트리에 없던 페이지는 변경 전 리포트에서 제외)
+    """
+    with tempfile.TemporaryDirectory() as root:
+        archive = subprocess.run(['git', 'archive', '--format=tar', rev], capture_output=True, check=True)
+        subprocess.run(['tar', '-x', '-C', root], input=archive.stdout, check=True)
+        for name in LOCAL_FILES:
+            if os.path.exists(name):
+                shutil.copy(name, os.path.join(root, name))
+
+        reports, baseline = {}, {}
+        for path in pages:
+            existed = os.path.exists(os.path.join(root, path))
+            now, before = [], []
+            for _ in range(repeat):
+                now.append(first_run(path))
+                if existed:
+                    before.append(first_run(path, root=root))
+            reports[path] = _report(path, '.', repeat, now)
+            if existed:
+                baseline[path] = _report(path, root, repeat, before)
+        return reports, baseline
+
+
+def _own_ms(modules):
+    return sum(us for name, us in modules.items() if name.split('.')[0] not in SHARED_MODULES) / 1000
+
+
+def _first_run_ms(report):
+    return f"{report['first_run'] * 1000:.0f}" + (' (예외)' if report['error'] else '')
+
+
+def render(reports, baseline=None, baseline_rev=None):
+    out = ['# 페이지별 첫 실행 / import 시간', '',
+           f'중앙값 (Python {sys.version.split()[0]}, CPU {os.cpu_count()}개)']
+    if baseline is not None:
+        out += [f'변경 전: `{baseline_rev}` 트리에서 같은 방법으로 측정']
+
+    out += ['', '## 첫 실행 (새 프로세스에서 `AppTest.from_file(page).run()` 한 번, streamlit import 제외)', '']
+    if baseline is not None:
+        out += ['| 페이지 | 변경 전 (ms) | 현재 (ms) | 차이 (ms) |', '| --- | ---: | ---: | ---: |']
+    else:
+        out += ['| 페이지 | 현재 (ms) |', '| --- | ---: |']
+    for path, report in reports.items():
+        row = [f'`{path}`', _first_run_ms(report)]
+        if baseline is not None:
+            before = baseline.get(path)
+            row.insert(1, _first_run_ms(before) if before else '-')
+            row.append(f"{(report['first_run'] - before['first_run']) * 1000:+.0f}" if before else '-')
+        out.append('| ' + ' | '.join(row) + ' |')
+
+    out += ['', '## 최상위 import (`python -X importtime`)', '']
+    if baseline is not None:
+        out += ['| 페이지 | 전체 (ms) | 변경 전 streamlit 제외 (ms) | streamlit 제외 (ms) | 주요 모듈 (ms) |',
+                '| --- | ---: | ---: | ---: | --- |']
+    else:
+        out += ['| 페이지 | 전체 (ms) | streamlit 제외 (ms) | 주요 모듈 (ms) |',
+                '| --- | ---: | ---: | --- |']
+    for path, report in reports.items():
+        modules = report['modules']
+        top = sorted(modules.items(), key=lambda kv: kv[1], reverse=True)[:5]
+        top_text = ', '.join(f'{name} {us / 1000:.0f}' for name, us in top if us >= 1000) or '-'
+        row = [f'`{path}`', f"{report['total'] / 1000:.0f}", f'{_own_ms(modules):.0f}', top_text]
+        if baseline is not None:
+            row.insert(2, f"{_own_ms(baseline[path]['modules']):.0f}" if path in baseline else '-')
+        out.append('| ' + ' | '.join(row) + ' |')
+    return '\n'.join(out) + '\n'
+
+
+def keep_notes(path, text):
+    """기존 출력 파일의 NOTES_MARKER 아래 내용을 새 리포트 뒤에 그대로 붙임"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            old = f.read()
+    except FileNotFoundError:
+        return text
+    if NOTES_MARKER not in old:
+        return text
+    return text + '\n' + NOTES_MARKER + old.split(NOTES_MARKER, 1)[1]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('pages', nargs='*', default=PAGE_FILES)
+    parser.add_argument('--repeat', type=int, default=3, help='페이지당 측정 횟수 (중앙값 사용)')
+    parser.add_argument('--baseline', help='비교할 변경 전 커밋 (예: 4c70dd5)')
+    parser.add_argument('-o', '--output', help='마크다운으로 저장할 경로')
+    args = parser.parse_args()
+
+    if args.baseline:
+        reports, baseline = compare_reports(args.baseline, args.pages, args.repeat)
+    else:
+        reports, baseline = {path: page_report(path, args.repeat) for path in args.pages}, None
+    text = render(reports, baseline, args.baseline)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        text = keep_notes(args.output, text)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(text)
@@ -0,0 +1,90 @@
+"""외부 사이트 대신 쓰는 로컬 대역(stand-in) HTTP 서버
+
+    python -m tools.standin_server --port 8765
+
+경로의 첫 부분으로 쇼핑몰을 구분: http://127.0.0.1:8765/<shop>/...
+(예: PriceAggregator(default_adapters(standin_base_urls(8765))))
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from services.price_search import ADAPTER_CLASSES
+
+# 쇼핑몰별 응답 지연(초)과 기준 가격 - 느린 쇼핑몰 한 곳이 전체 지연을 결정하는지 확인용
+SHOP_DELAYS = {'coupang': 0.05, 'gmarket': 0.10, 'st11': 0.20, 'lotte': 0.30, 'auction': 0.15}
+SHOP_BASE_PRICE = {'coupang': 9800, 'gmarket': 9500, 'st11': 10100, 'lotte': 12000, 'auction': 9700}
+QUERY_PARAMS = ('q', 'keyword', 'kwd', 'headerQuery')
+
+
+def standin_base_urls(port, host='127.0.0.1'):
+    return {cls.name: f"http://{host}:{port}/{cls.name}" for cls in ADAPTER_CLASSES}
+
+
+def canned_result_page(shop, query, count=5):
+    """JSON-LD ItemList가 들어있는 가짜 검색 결과 페이지"""
+    base = SHOP_BASE_PRICE.get(shop, 10000)
+    items = [{
+        '@type': 'ListItem',
+        'position': i + 1,
+        'item': {
+            '@type': 'Product',
+            'name': f"{query} {shop} 상품 {i + 1}",
+            'offers': {'@type': 'Offer', 'price': f"{base + i * 350:,}", 'url': f"/{shop}/item/{i + 1}"},
+        },
+    } for i in range(count)]
+    ld = json.dumps({'@context': 'https://schema.org', '@type': 'ItemList', 'itemListElement': items},
+                    ensure_ascii=False)
+    return f'<html><head><script type="application/ld+json">{ld}</script></head><body></body></html>'
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    # 다른 대역 데이터(예: CSV)는 서버 생성 후 routes에 {경로 접두사: (content-type, bytes)}로 등록
+    routes = {}
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        for prefix, (content_type, body) in self.routes.items():
+            if parsed.path.startswith(prefix):
+                return self._send(200, content_type, body)
+
+        shop = parsed.path.strip('/').split('/')[0]
+        if shop not in SHOP_DELAYS:
+            return self._send(404, 'text/plain', b'not found')
+
+        params = parse_qs(parsed.query)
+        query = next((params[k][0] for k in QUERY_PARAMS if k in params), '')
+        time.sleep(SHOP_DELAYS[shop])
+        self._send(200, 'text/html; charset=utf-8', canned_result_page(shop, query).encode('utf-8'))
+
+    def _send(self, code, content_type, body):
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_standin_server(port=0, host='127.0.0.1', routes=None):
+    """백그라운드 스레드로 서버 시작 -> (server, 실제 포트)"""
+    handler = type('Handler', (StandinHandler,), {'routes': dict(routes or {})})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), StandinHandler)
+    print(f"stand-in server: http://{args.host}:{args.port}/<shop>/...")
+    server.serve_forever()